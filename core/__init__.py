@@ -25,7 +25,6 @@ from core.types import (
     Provider,
 )
 from core.config import load_config, get_telegram_config
-from core.processor import AgencyProcessor
 from core.queue import FileQueue
 
 __all__ = [
@@ -39,3 +38,12 @@ __all__ = [
     "AgencyProcessor",
     "FileQueue",
 ]
+
+
+def __getattr__(name):
+    # AgencyProcessor pulls in the Anthropic client; import it on first use so
+    # light entry points (the CLI, channels) don't pay for it
+    if name == "AgencyProcessor":
+        from core.processor import AgencyProcessor
+        return AgencyProcessor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
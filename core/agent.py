@@ -4,6 +4,7 @@ Each agent runs in isolation with its own workspace and context.
 """
 
 import asyncio
+import json
 import logging
 import os
 from pathlib import Path
@@ -11,9 +12,24 @@ from typing import Dict, List, Optional
 import anthropic
 from core.tools import ToolRegistry
 
+try:
+    import orjson
+except ImportError:  # Optional C-accelerated JSON
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
+# Short model names accepted in agent configs
+MODEL_MAP = {
+    "sonnet": "claude-sonnet-4-5-20250929",
+    "opus": "claude-opus-4-6",
+    "haiku": "claude-haiku-4-5-20251001",
+}
+
+# Maximum number of built system prompts kept in memory
+SYSTEM_PROMPT_CACHE_SIZE = 128
+
 
 class AgentInvoker:
     """
@@ -43,6 +59,11 @@ class AgentInvoker:
         else:
             self.anthropic_client = None
 
+        # Built system prompts keyed by (agent_dir, file mtimes, tools enabled)
+        self._system_prompt_cache: Dict[tuple, str] = {}
+        # Team context each agent directory was last set up for
+        self._setup_done: Dict[Path, Optional[Dict]] = {}
+
     async def invoke_agent(
         self,
         agent_config,
@@ -120,6 +141,10 @@ class AgentInvoker:
         - TEAMMATES.md - Information about teammates (if in a team)
         - conversation.json - Conversation history
         """
+        # Nothing to do if an earlier invocation set up the same team context
+        if agent_dir in self._setup_done and self._setup_done[agent_dir] == team_context:
+            return
+
         agent_dir.mkdir(parents=True, exist_ok=True)
 
         # Create IDENTITY.md
@@ -162,7 +187,16 @@ Example: "I've analyzed the data. [@reviewer: please review my findings]"
 
 Your teammate will receive your message and can respond. Multiple teammates can be mentioned in one message.
 """
-            teammates_file.write_text(teammates_content)
+            # Rewriting unchanged content would bump the mtime and
+            # invalidate the cached system prompt
+            try:
+                current_content = teammates_file.read_text()
+            except FileNotFoundError:
+                current_content = None
+            if current_content != teammates_content:
+                teammates_file.write_text(teammates_content)
+
+        self._setup_done[agent_dir] = team_context
 
     def _format_teammates(self, team_context: Dict, current_agent_id: str) -> str:
         """Format teammates list for TEAMMATES.md"""
@@ -185,11 +219,23 @@ Your teammate will receive your message and can respond. Multiple teammates can
         tool_registry: Optional[ToolRegistry] = None
     ) -> str:
         """Build system prompt from agent directory files"""
+        identity_file = agent_dir / "IDENTITY.md"
+        teammates_file = agent_dir / "TEAMMATES.md"
+        has_tools = bool(tool_registry and tool_registry.tool_schemas)
+
+        # Reuse the prompt built for the same files unless either was modified
+        identity_stamp = self._file_stamp(identity_file)
+        teammates_stamp = self._file_stamp(teammates_file)
+        key = (agent_dir, identity_stamp, teammates_stamp, has_tools)
+        cached = self._system_prompt_cache.get(key)
+        if cached is not None:
+            return cached
+
         parts = []
 
         # 🚨 CRITICAL: Add tool guidance FIRST before identity/personality
         # This ensures Claude sees the mandatory tool-use rules before any role-play examples
-        if tool_registry and tool_registry.tool_schemas:
+        if has_tools:
             tool_guidance = """
 ## ⚠️ CRITICAL: YOU MUST USE YOUR REAL TOOLS
 
@@ -224,29 +270,39 @@ You: "Here are your meetings: 9am Team Sync, 2pm Review..." ← NEVER DO THIS! Y
             parts.append(tool_guidance)
 
         # NOW add identity/personality (after tool rules are established)
-        identity_file = agent_dir / "IDENTITY.md"
-        if identity_file.exists():
+        if identity_stamp is not None:
             parts.append(identity_file.read_text())
 
         # Add teammates info
-        teammates_file = agent_dir / "TEAMMATES.md"
-        if teammates_file.exists():
+        if teammates_stamp is not None:
             parts.append(teammates_file.read_text())
 
-        return "\n\n".join(parts)
+        system_prompt = "\n\n".join(parts)
+        if len(self._system_prompt_cache) >= SYSTEM_PROMPT_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._system_prompt_cache[next(iter(self._system_prompt_cache))]
+        self._system_prompt_cache[key] = system_prompt
+        return system_prompt
+
+    @staticmethod
+    def _file_stamp(path: Path) -> Optional[tuple]:
+        """
+        Return (mtime in ns, size) identifying a file's version, or None if it
+        doesn't exist. The size catches rewrites within one mtime tick on
+        filesystems with coarse timestamps.
+        """
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
 
     async def _invoke_anthropic(self, model: str, system_prompt: str, history: list) -> str:
         """Invoke Anthropic Claude API (without tools - legacy)"""
         if not self.anthropic_client:
             raise ValueError("Anthropic API key not configured")
 
-        # Map model names
-        model_map = {
-            "sonnet": "claude-sonnet-4-5-20250929",
-            "opus": "claude-opus-4-6",
-            "haiku": "claude-haiku-4-5-20251001",
-        }
-        model_id = model_map.get(model, model)
+        model_id = MODEL_MAP.get(model, model)
 
         try:
             response = await asyncio.to_thread(
@@ -278,13 +334,7 @@ You: "Here are your meetings: 9am Team Sync, 2pm Review..." ← NEVER DO THIS! Y
         if not self.anthropic_client:
             raise ValueError("Anthropic API key not configured")
 
-        # Map model names
-        model_map = {
-            "sonnet": "claude-sonnet-4-5-20250929",
-            "opus": "claude-opus-4-6",
-            "haiku": "claude-haiku-4-5-20251001",
-        }
-        model_id = model_map.get(model, model)
+        model_id = MODEL_MAP.get(model, model)
 
         # Get tools if available
         tools = tool_registry.get_tool_schemas() if tool_registry else None
@@ -385,43 +435,10 @@ You: "Here are your meetings: 9am Team Sync, 2pm Review..." ← NEVER DO THIS! Y
                     "content": response.content
                 })
 
-                # Execute tools and collect results
-                tool_results = []
-                for tool_use in tool_uses:
-                    tool_name = tool_use.name
-                    tool_input = tool_use.input
-                    logger.info(f"Executing tool: {tool_name} with input: {tool_input}")
-
-                    try:
-                        # Execute the tool
-                        result = await tool_registry.execute_tool(tool_name, tool_input)
-
-                        # Convert result to string if needed
-                        if isinstance(result, dict):
-                            import json
-                            result_content = json.dumps(result, indent=2)
-                        elif isinstance(result, list):
-                            import json
-                            result_content = json.dumps(result, indent=2)
-                        else:
-                            result_content = str(result)
-
-                        tool_results.append({
-                            "type": "tool_result",
-                            "tool_use_id": tool_use.id,
-                            "content": result_content
-                        })
-
-                        logger.info(f"Tool {tool_name} executed successfully")
-
-                    except Exception as e:
-                        logger.error(f"Tool {tool_name} execution failed: {e}")
-                        tool_results.append({
-                            "type": "tool_result",
-                            "tool_use_id": tool_use.id,
-                            "content": f"Error: {str(e)}",
-                            "is_error": True
-                        })
+                # Execute tools concurrently; gather keeps results in tool_use order
+                tool_results = list(await asyncio.gather(
+                    *(self._run_tool(tool_registry, tool_use) for tool_use in tool_uses)
+                ))
 
                 # Add tool results to history
                 history.append({
@@ -461,6 +478,38 @@ You: "Here are your meetings: 9am Team Sync, 2pm Review..." ← NEVER DO THIS! Y
             logger.error(f"Anthropic API error: {e}")
             raise
 
+    async def _run_tool(self, tool_registry: ToolRegistry, tool_use) -> Dict:
+        """Execute one tool_use block and wrap the outcome as a tool_result"""
+        tool_name = tool_use.name
+        tool_input = tool_use.input
+        logger.info(f"Executing tool: {tool_name} with input: {tool_input}")
+
+        try:
+            # Execute the tool
+            result = await tool_registry.execute_tool(tool_name, tool_input)
+
+            # Convert result to string if needed
+            if isinstance(result, (dict, list)):
+                result_content = json.dumps(result, indent=2)
+            else:
+                result_content = str(result)
+
+            logger.info(f"Tool {tool_name} executed successfully")
+            return {
+                "type": "tool_result",
+                "tool_use_id": tool_use.id,
+                "content": result_content
+            }
+
+        except Exception as e:
+            logger.error(f"Tool {tool_name} execution failed: {e}")
+            return {
+                "type": "tool_result",
+                "tool_use_id": tool_use.id,
+                "content": f"Error: {str(e)}",
+                "is_error": True
+            }
+
     async def _invoke_openai(self, model: str, system_prompt: str, history: list) -> str:
         """Invoke OpenAI API"""
         # TODO: Implement OpenAI support
@@ -468,12 +517,11 @@ You: "Here are your meetings: 9am Team Sync, 2pm Review..." ← NEVER DO THIS! Y
 
     def _load_history(self, history_file: Path) -> list:
         """Load conversation history from file"""
-        import json
         try:
-            with open(history_file, 'r') as f:
-                history = json.load(f)
-                # Prune history to prevent token overflow
-                return self._prune_history(history)
+            raw = history_file.read_bytes()
+            history = orjson.loads(raw) if orjson else json.loads(raw)
+            # Prune history to prevent token overflow
+            return self._prune_history(history)
         except Exception as e:
             logger.warning(f"Could not load history: {e}")
             return []
@@ -505,11 +553,21 @@ You: "Here are your meetings: 9am Team Sync, 2pm Review..." ← NEVER DO THIS! Y
 
     def _save_history(self, history_file: Path, history: list):
         """Save conversation history to file"""
-        import json
         try:
             # Prune before saving to keep file size manageable
             pruned_history = self._prune_history(history, max_messages=10)
-            with open(history_file, 'w') as f:
-                json.dump(pruned_history, f, indent=2)
+            # Compact form: this runs on every turn, pretty-printing isn't worth it
+            if orjson:
+                raw = orjson.dumps(pruned_history)
+            else:
+                raw = json.dumps(pruned_history, separators=(',', ':')).encode()
+            # Write to a temp file and swap it in so a crash mid-write can't
+            # leave a truncated conversation.json behind
+            tmp_file = history_file.with_suffix(".json.tmp")
+            with open(tmp_file, 'wb') as f:
+                f.write(raw)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, history_file)
         except Exception as e:
             logger.error(f"Could not save history: {e}")
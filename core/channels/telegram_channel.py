@@ -4,21 +4,302 @@ Connects Telegram bot to the file-based queue system.
 """
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import lru_cache, partial
+import hashlib
+import json
 import logging
 from pathlib import Path
+import signal
 import time
 from typing import Optional
 import os
+import re
 
-from telegram import Update
-from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
+from telegram import BotCommand, Update
+from telegram.constants import ChatAction
+from telegram.error import RetryAfter
+from telegram.ext import AIORateLimiter, Application, CommandHandler, MessageHandler, filters, ContextTypes
 
+from core import router
 from core.types import MessageData, AgencyConfig
 from core.queue import FileQueue
 
+try:
+    from asyncinotify import Inotify, Mask
+except ImportError:  # Optional (Linux only): fall back to polling
+    Inotify = None
+
+try:
+    from watchfiles import Change, awatch
+except ImportError:  # Optional: portable watcher where inotify is missing
+    awatch = None
+
 
 logger = logging.getLogger(__name__)
 
+# Outgoing delivery retry policy
+MAX_SEND_RETRIES = 5        # Attempts before a message is dead-lettered
+MAX_RETRY_DELAY = 60        # Cap (seconds) for per-message exponential backoff
+MAX_FLOOD_WAITS = 3         # Flood-control pauses before a send counts as failed
+POLL_INTERVAL = 0.5         # Outgoing queue poll interval (seconds)
+MAX_POLL_ERROR_DELAY = 5    # Cap (seconds) for poller error backoff
+RESCAN_INTERVAL = 5         # Safety rescan (seconds) when inotify drives the poller
+SHUTDOWN_TIMEOUT = 10       # Seconds in-progress sends get to finish on shutdown
+
+# Telegram updates handled in parallel by the application
+CONCURRENT_UPDATES = 32
+MAX_CONCURRENT_SENDS = 20   # Chats whose queued responses are sent at once
+# Bot API connections: enough for concurrent handler replies plus queued sends
+CONNECTION_POOL_SIZE = CONCURRENT_UPDATES + MAX_CONCURRENT_SENDS
+MAX_MESSAGE_LENGTH = 4000   # Telegram allows 4096 chars; leave some margin
+TYPING_INTERVAL = 4.0       # Telegram shows "typing…" for ~5s per chat action
+
+# Display names used when a shortcut command's agent is missing
+AGENT_LABELS = {
+    "cc": "CC",
+    "job_hunter": "Job Hunter",
+    "researcher": "Researcher",
+}
+
+# Shortcut commands that forward a fixed prompt to an agent:
+# command -> (required agent ID or None, prompt, acknowledgement reply)
+COMMAND_TEMPLATES = {
+    # CC Agent Commands
+    "briefing": (
+        "cc",
+        "@cc Good morning! Please give me a daily briefing with my calendar, emails, and priorities.",
+        "☀️ Good morning! Preparing your daily briefing...",
+    ),
+    "emails": (
+        "cc",
+        "@cc Show me my unread emails, prioritized by importance.",
+        "📧 Checking your emails...",
+    ),
+    "calendar": (
+        "cc",
+        "@cc Show me my calendar for today with all meeting details.",
+        "📅 Checking your calendar...",
+    ),
+    "meeting": (
+        "cc",
+        "@cc What's my next meeting? Include attendees, agenda, and any relevant context from emails.",
+        "🔜 Checking your next meeting...",
+    ),
+
+    # Job Hunter Commands
+    "trackjobs": (
+        "job_hunter",
+        "@job_hunter Show me all my tracked jobs and their current status.",
+        "📊 Loading your tracked jobs...",
+    ),
+    "applications": (
+        "job_hunter",
+        "@job_hunter Show me all my job applications and their current status.",
+        "📝 Loading your job applications...",
+    ),
+
+    # Proactive Commands
+    "proactive": (
+        None,
+        "@cc Run a proactive check: 1) Check for meetings in next 30 minutes and prepare brief, 2) Check for urgent/important unread emails, 3) Check for approaching deadlines, 4) Check for calendar conflicts, 5) Identify pending action items from recent emails. Summarize only items that need attention.",
+        "🤖 Running proactive check...",
+    ),
+    "meetingprep": (
+        None,
+        "@cc Prepare me for my next meeting (within next 60 minutes). Include: 1) Meeting details (what, when, where, who), 2) Recent emails from/to attendees (last 3 days), 3) Related files in Drive, 4) Previous meeting notes if available, 5) Suggested talking points, 6) Pending action items. Format as a concise meeting prep brief. If no meeting in next hour, show meetings for rest of today.",
+        "🔜 Preparing for your next meeting...",
+    ),
+    "digest": (
+        None,
+        "@cc Give me a comprehensive daily digest: 1) Priority inbox (urgent/important emails), 2) Today's full schedule, 3) Next meeting prep, 4) Deadlines this week, 5) Pending action items, 6) Recent files, 7) Smart suggestions. Format with sections and emojis.",
+        "📊 Generating your daily digest...",
+    ),
+    "midday": (
+        None,
+        "@cc Give me a midday check-in: 1) Time status (meetings so far, remaining meetings, available focus time), 2) New urgent items since morning, 3) Afternoon prep (next meeting details), 4) Quick wins (action items that can be done now). Keep it brief.",
+        "🌞 Midday check-in coming up...",
+    ),
+    "eod": (
+        None,
+        "@cc Give me an end of day summary: 1) Today's accomplishments (meetings, emails handled, tasks done), 2) Inbox status (unread count, urgent pending), 3) Tomorrow's preview (all meetings, time for work, important events), 4) Pending items that didn't get done, 5) Prep needed for tomorrow, 6) Top priority for tomorrow. Format as encouraging wrap-up.",
+        "🌙 Wrapping up your day...",
+    ),
+
+    # Other Commands
+    "research": (
+        "researcher",
+        "@researcher What's new and interesting in AI today? Check ArXiv, Twitter, Hacker News, and major AI labs.",
+        "🔬 Researching latest AI developments...",
+    ),
+
+    # Feedback Management Commands
+    "clusterfeedback": (
+        None,
+        "@feedback_team Run the cluster-feedback skill to group all new feedback reports into themes. Identify patterns, create clusters with high-level themes, perform root cause analysis, and report on the clusters created.",
+        (
+            "🎯 **Clustering Feedback...**\n\n"
+            "Analyzing feedback reports and grouping by theme...\n"
+            "This may take a moment."
+        ),
+    ),
+    "trackbugs": (
+        None,
+        "@feedback_team Run the track-bugs skill to create bugs from feedback clusters and post updates on existing bugs when new related reports arrive. Report on bugs created and updated.",
+        (
+            "🐛 **Tracking Bugs...**\n\n"
+            "Creating and updating bug reports from feedback clusters..."
+        ),
+    ),
+    "generatesolutions": (
+        None,
+        "@feedback_team Run the generate-solutions skill to create comprehensive solutions for all open bugs. Include PRDs (Product Requirement Documents), coding agent prompts, trade-off analysis, and effort estimates. Report on solutions generated.",
+        (
+            "💡 **Generating Solutions...**\n\n"
+            "Creating PRDs, prototypes, and coding prompts for bugs...\n"
+            "This will include trade-offs and effort estimates."
+        ),
+    ),
+    "feedbackreport": (
+        None,
+        "@feedback_team Run the feedback-report skill to generate a comprehensive analytics report. Include: total feedback count, status breakdown, top issues by feedback count, trend analysis, bug statistics, and solution progress. Present in a clear, formatted summary.",
+        (
+            "📊 **Generating Feedback Report...**\n\n"
+            "Analyzing system-wide feedback metrics, trends, and top issues..."
+        ),
+    ),
+}
+
+# Extra command names that trigger the same template
+COMMAND_ALIASES = {
+    "briefing": ("morning",),
+}
+
+# Replies are sent without parse_mode, so Markdown in static messages is
+# stripped once at import instead of showing up as literal ** and `
+_MD_MARKERS = re.compile(r"\*\*|`")
+
+
+def _strip_md(text: str) -> str:
+    """Remove Markdown markers from a reply that is sent as plain text"""
+    return _MD_MARKERS.sub("", text)
+
+
+_MSG_START = _strip_md(
+    "🤖 **Your Proactive AI Multi-Agent Team**\n\n"
+    "I coordinate powerful AI agents to keep you ahead of your day!\n\n"
+    "**🌟 CC Agent (Productivity):**\n"
+    "• `/morning` - Daily briefing 📋\n"
+    "• `/emails` - Check inbox 📧\n"
+    "• `/calendar` - Today's schedule 📅\n"
+    "• `/meeting` - Next meeting prep 🔜\n\n"
+    "**🤖 Proactive Features:**\n"
+    "• `/proactive` - Smart check (urgent items, meetings, deadlines) 🔍\n"
+    "• `/meetingprep` - Auto prep for next meeting 🔜\n"
+    "• `/digest` - Full daily digest 📊\n"
+    "• `/midday` - Midday check-in 🌞\n"
+    "• `/eod` - End of day summary 🌙\n\n"
+    "**💼 Job Hunter (Career):**\n"
+    "• `/jobs` - Quick job search 🔍\n"
+    "• `/jobsearch [query]` - Custom search 🎯\n"
+    "• `/trackjobs` - Tracked jobs 📊\n"
+    "• `/applications` - Your applications 📝\n\n"
+    "**🔧 System:**\n"
+    "• `/help` - Full command list\n"
+    "• `/agents` - Available agents\n"
+    "• `/status` - System status\n\n"
+    "**💬 Or just chat naturally:**\n"
+    "`@cc What's on my calendar?`\n"
+    "`@job_hunter Find Java jobs at TCS`\n\n"
+    "Type /help for more details! 🚀"
+)
+
+_MSG_FALLBACK_HELP = _strip_md("""
+**Available Commands:**
+
+• `/start` - Start the bot
+• `/help` - Show this help message
+
+**How to talk to agents:**
+
+Use `@agent_id` to route messages:
+```
+@researcher What's new in AI?
+@social Post a tweet about AI trends
+@writer Draft a newsletter
+```
+
+Just message me naturally with an @mention!
+""")
+
+_MSG_JOBSEARCH_USAGE = _strip_md(
+    "💡 **Job Search Examples:**\n\n"
+    "🔹 `/jobsearch Java Developer at TCS in India`\n"
+    "🔹 `/jobsearch Software Engineer at Wipro`\n"
+    "🔹 `/jobsearch ML Engineer with Python and PyTorch`\n"
+    "🔹 `/jobsearch Product Manager remote`\n"
+    "🔹 `/jobsearch Senior Java Developer 5+ years`\n\n"
+    "Or use: `/jobs` for quick general search!"
+)
+
+_MSG_NO_TARGET = _strip_md(
+    "💬 Start your message with `@agent_id` or `@team_id` so I know who should handle it.\n\n"
+    "Example: `@cc What's on my calendar?`\n"
+    "Use /agents or /teams to see who's available."
+)
+
+_MSG_FEEDBACK_USAGE = _strip_md(
+    "📝 **Submit Feedback**\n\n"
+    "Usage: `/submitfeedback Your feedback here`\n\n"
+    "Example: `/submitfeedback The app is very slow when loading the dashboard`"
+)
+
+
+def _chat_metadata(chat_id: int, user_id: int) -> dict:
+    """
+    Metadata for a message from user_id in chat_id.
+
+    A new dict is built for every message: metadata is mutable and may be
+    updated downstream (e.g. retry state), so it must never be shared.
+    """
+    return {"chat_id": chat_id, "user_id": user_id}
+
+
+def _split_message(text: str, limit: int) -> list:
+    """
+    Split text into chunks of at most limit characters, breaking at newlines.
+
+    Scans by offset and slices each chunk once; a line longer than limit is
+    cut at the limit.
+    """
+    chunks = []
+    start = 0
+    while len(text) - start > limit:
+        cut = text.rfind("\n", start, start + limit + 1)
+        if cut <= start:
+            cut = start + limit
+        chunk = text[start:cut].strip()
+        if chunk:
+            chunks.append(chunk)
+        start = cut + 1 if text.startswith("\n", cut) else cut
+
+    tail = text[start:].strip()
+    if tail:
+        chunks.append(tail)
+    return chunks
+
+
+@lru_cache(maxsize=4096)
+def _sender_id(user_id: int) -> str:
+    """String form of a Telegram user ID (cached, since the same users repeat)"""
+    return str(user_id)
+
+
+def _sender_name(user) -> str:
+    """Display name recorded as the sender of a user's messages"""
+    return user.username or user.first_name
+
 
 class TelegramChannel:
     """
@@ -49,11 +330,83 @@ class TelegramChannel:
         """
         self.bot_token = bot_token
         self.queue = queue
-        self.allowed_users = set(allowed_users) if allowed_users else None
+        # Telegram user IDs are ints; normalise so "123" and 123 both match
+        self.allowed_users = frozenset(int(u) for u in allowed_users) if allowed_users else None
         self.config = config
 
-        # Create Telegram application
-        self.app = Application.builder().token(bot_token).build()
+        # Configured agent IDs (None when no config, which allows every command)
+        self._agents_set = frozenset(config.agents) if config else None
+        # Valid @targets for plain messages (agents and teams)
+        self._targets = self._agents_set | frozenset(config.teams) if config else None
+
+        # Pre-built messages for shortcut commands; handlers clone and fill in
+        # the per-request fields instead of constructing from scratch
+        self._templates = {
+            command: MessageData(
+                channel="telegram",
+                sender="",
+                sender_id="",
+                message=prompt,
+                timestamp=0.0,
+                message_id="",
+            )
+            for command, (_, prompt, _) in COMMAND_TEMPLATES.items()
+        }
+
+        # Queue reads and writes are blocking file I/O, so they run here
+        # instead of on the event loop
+        self._io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="telegram-io")
+        self._pending = []  # (MessageData, Future) waiting for _flush_pending
+
+        # chat_id -> monotonic time of the last "typing" action (see _send_typing)
+        self._typing_sent = {}
+
+        # Replies that only depend on the config are built once up front
+        self._help_text = self._build_help_text()
+        self._status_text = self._build_status_text()
+        self._agents_text = self._build_agents_text()
+        self._teams_text = self._build_teams_text()
+        self._bot_commands = self._build_bot_commands()
+
+        # Set by the outgoing watcher when a file lands in outgoing/ (asyncio
+        # primitives are created in start(), on the loop that runs the bot)
+        self._outgoing_ready = None
+        self._outgoing_changed = set()  # Paths reported since the last scan
+
+        # Per-chat sender queues (see _dispatch), their worker tasks and the
+        # files they hold; the semaphore bounds how many chats are sent to at once
+        self._chat_queues = {}
+        self._chat_workers = set()
+        self._in_flight = set()
+        self._send_slots = None
+        # Earliest time a backed-off outgoing message falls due
+        self._retry_at = float("inf")
+        # Outgoing files that failed to parse -> (mtime_ns, size) when they did;
+        # scans skip them until the file changes (see _read_pending)
+        self._unreadable = {}
+        self._watching_outgoing = False
+
+        # Set by SIGINT/SIGTERM to shut the bot down
+        self._stop_event = None
+
+        # Create Telegram application. Updates are handled concurrently so one
+        # slow handler doesn't hold up the rest; handlers only share the queue,
+        # whose writes go to uniquely named files and are safe to overlap.
+        # All bot API calls (replies and queued responses) share one rate
+        # limiter, which also retries requests Telegram answers with 429, and
+        # one connection pool sized so those calls don't wait for a connection.
+        self.app = (
+            Application.builder()
+            .token(bot_token)
+            .concurrent_updates(CONCURRENT_UPDATES)
+            .rate_limiter(AIORateLimiter(max_retries=3))
+            .connection_pool_size(CONNECTION_POOL_SIZE)
+            .pool_timeout(30.0)
+            .connect_timeout(10.0)
+            .read_timeout(20.0)
+            .write_timeout(20.0)
+            .build()
+        )
 
         # Add command handlers
         self.app.add_handler(CommandHandler("start", self._handle_start))
@@ -62,46 +415,56 @@ class TelegramChannel:
         self.app.add_handler(CommandHandler("agents", self._handle_agents))
         self.app.add_handler(CommandHandler("teams", self._handle_teams))
 
-        # CC Agent Commands
-        self.app.add_handler(CommandHandler("briefing", self._handle_briefing))
-        self.app.add_handler(CommandHandler("morning", self._handle_briefing))  # Alias
-        self.app.add_handler(CommandHandler("emails", self._handle_emails))
-        self.app.add_handler(CommandHandler("calendar", self._handle_calendar))
-        self.app.add_handler(CommandHandler("meeting", self._handle_next_meeting))
+        # Shortcut commands driven by COMMAND_TEMPLATES
+        for command in COMMAND_TEMPLATES:
+            names = (command, *COMMAND_ALIASES.get(command, ()))
+            self.app.add_handler(CommandHandler(names, self._make_handler(command)))
 
         # Job Hunter Commands
         self.app.add_handler(CommandHandler("jobs", self._handle_jobs))
         self.app.add_handler(CommandHandler("jobsearch", self._handle_job_search))
-        self.app.add_handler(CommandHandler("trackjobs", self._handle_track_jobs))
-        self.app.add_handler(CommandHandler("applications", self._handle_applications))
-
-        # Proactive Commands
-        self.app.add_handler(CommandHandler("proactive", self._handle_proactive))
-        self.app.add_handler(CommandHandler("meetingprep", self._handle_meeting_prep))
-        self.app.add_handler(CommandHandler("digest", self._handle_digest))
-        self.app.add_handler(CommandHandler("midday", self._handle_midday))
-        self.app.add_handler(CommandHandler("eod", self._handle_eod))
-
-        # Other Commands
-        self.app.add_handler(CommandHandler("research", self._handle_research))
 
         # Feedback Management Commands
         self.app.add_handler(CommandHandler("submitfeedback", self._handle_submit_feedback))
-        self.app.add_handler(CommandHandler("clusterfeedback", self._handle_cluster_feedback))
-        self.app.add_handler(CommandHandler("trackbugs", self._handle_track_bugs))
-        self.app.add_handler(CommandHandler("generatesolutions", self._handle_generate_solutions))
-        self.app.add_handler(CommandHandler("feedbackreport", self._handle_feedback_report))
 
-        # Add message handler (non-commands)
-        self.app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self._handle_message))
+        # Add message handler (non-commands). With an allow-list, unknown users
+        # are filtered out by the dispatcher and routed to a rejection reply.
+        text_filter = filters.TEXT & ~filters.COMMAND
+        if self.allowed_users:
+            allowed = filters.User(user_id=self.allowed_users)
+            self.app.add_handler(MessageHandler(text_filter & allowed, self._handle_message))
+            self.app.add_handler(MessageHandler(text_filter & ~allowed, self._handle_unauthorized))
+        else:
+            self.app.add_handler(MessageHandler(text_filter, self._handle_message))
 
         logger.info("Telegram channel initialized")
 
     async def _register_bot_commands(self):
         """Register commands with Telegram so they show in the UI menu"""
-        from telegram import BotCommand
+        # Skip the API call when this bot's menu is unchanged since the last
+        # upload. The bot ID (the token's prefix) is part of the digest so a
+        # different bot sharing the queue directory still gets its menu.
+        bot_id = self.bot_token.split(":", 1)[0]
+        payload = json.dumps([bot_id, [(c.command, c.description) for c in self._bot_commands]])
+        digest = hashlib.blake2b(payload.encode()).hexdigest()
+        hash_file = self.queue.queue_path / ".commands_hash"
+        try:
+            if hash_file.read_text() == digest:
+                logger.info("Bot commands unchanged, skipping registration")
+                return
+        except FileNotFoundError:
+            pass
+
+        if not await self.app.bot.set_my_commands(self._bot_commands):
+            logger.warning("Telegram did not accept the bot commands; will retry on next start")
+            return
+        hash_file.write_text(digest)
+        logger.info("Registered %s commands with Telegram", len(self._bot_commands))
 
-        commands = [
+    @staticmethod
+    def _build_bot_commands() -> list:
+        """Build the command menu shown in the Telegram UI"""
+        return [
             # CC Commands
             BotCommand("morning", "☀️ Daily briefing"),
             BotCommand("briefing", "📋 Daily briefing (same as /morning)"),
@@ -135,323 +498,332 @@ class TelegramChannel:
             BotCommand("status", "📊 System status"),
         ]
 
-        await self.app.bot.set_my_commands(commands)
-        logger.info(f"Registered {len(commands)} commands with Telegram")
-
     async def start(self):
         """Start Telegram bot (runs forever)"""
         logger.info("Starting Telegram bot...")
 
+        # Before Python 3.10 these bind to the loop current at creation, so
+        # they are made here rather than in __init__
+        self._stop_event = asyncio.Event()
+        self._outgoing_ready = asyncio.Event()
+        self._send_slots = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+
         # Register commands with Telegram (so they show in menu)
         await self._register_bot_commands()
 
-        # Start polling outgoing queue in background
-        asyncio.create_task(self._poll_outgoing())
+        # Start polling outgoing queue in background, woken by a file watcher
+        # when one is available
+        background = [asyncio.create_task(self._poll_outgoing())]
+        if Inotify is not None:
+            background.append(asyncio.create_task(self._watch_outgoing()))
+        elif awatch is not None:
+            background.append(asyncio.create_task(self._watch_outgoing_portable()))
 
         # Start bot
         await self.app.initialize()
         await self.app.start()
         await self.app.updater.start_polling()
 
-        # Keep running
+        # Keep running until a shutdown signal arrives
+        loop = asyncio.get_running_loop()
+        handled_signals = []
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+                handled_signals.append(sig)
+            except NotImplementedError:
+                # Windows: fall back to KeyboardInterrupt
+                pass
+
         try:
-            while True:
-                await asyncio.sleep(1)
+            await self._stop_event.wait()
         except KeyboardInterrupt:
-            logger.info("Shutting down Telegram bot...")
+            pass
         finally:
+            logger.info("Shutting down Telegram bot...")
+            # Restore default handling so a second Ctrl+C can force an exit
+            # if shutdown hangs
+            for sig in handled_signals:
+                loop.remove_signal_handler(sig)
+            for task in background:
+                task.cancel()
+            await asyncio.gather(*background, return_exceptions=True)
+            await self._drain_chat_workers()
             await self.app.updater.stop()
             await self.app.stop()
             await self.app.shutdown()
+            self._io_executor.shutdown(wait=True)
 
-    async def _handle_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /start command"""
-        user = update.effective_user
-        await update.message.reply_text(
-            f"👋 Hi {user.first_name}!\n\n"
-            "🤖 **Your Proactive AI Multi-Agent Team**\n\n"
-            "I coordinate powerful AI agents to keep you ahead of your day!\n\n"
-            "**🌟 CC Agent (Productivity):**\n"
-            "• `/morning` - Daily briefing 📋\n"
-            "• `/emails` - Check inbox 📧\n"
-            "• `/calendar` - Today's schedule 📅\n"
-            "• `/meeting` - Next meeting prep 🔜\n\n"
-            "**🤖 Proactive Features:**\n"
-            "• `/proactive` - Smart check (urgent items, meetings, deadlines) 🔍\n"
-            "• `/meetingprep` - Auto prep for next meeting 🔜\n"
-            "• `/digest` - Full daily digest 📊\n"
-            "• `/midday` - Midday check-in 🌞\n"
-            "• `/eod` - End of day summary 🌙\n\n"
-            "**💼 Job Hunter (Career):**\n"
-            "• `/jobs` - Quick job search 🔍\n"
-            "• `/jobsearch [query]` - Custom search 🎯\n"
-            "• `/trackjobs` - Tracked jobs 📊\n"
-            "• `/applications` - Your applications 📝\n\n"
-            "**🔧 System:**\n"
-            "• `/help` - Full command list\n"
-            "• `/agents` - Available agents\n"
-            "• `/status` - System status\n\n"
-            "**💬 Or just chat naturally:**\n"
-            "`@cc What's on my calendar?`\n"
-            "`@job_hunter Find Java jobs at TCS`\n\n"
-            "Type /help for more details! 🚀"
-        )
+    def stop(self):
+        """Ask a running start() to shut the bot down"""
+        if self._stop_event is not None:
+            self._stop_event.set()
 
-    async def _handle_help(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /help command - dynamically generated from agency config"""
+    async def _drain_chat_workers(self):
+        """
+        Let chat workers finish the responses already handed to them.
 
-        if self.config:
-            # Generate dynamic help from actual config
-            help_text = "🤖 **Agency - Your AI Assistant Team**\n\n"
-
-            # Available Agents section
-            if self.config.agents:
-                help_text += "**Available Agents:**\n"
-                for agent_id, agent in self.config.agents.items():
-                    # Create a short description from the first line of personality
-                    desc = agent.personality.split('.')[0] if agent.personality else agent.name
-                    help_text += f"• `@{agent_id}` - {agent.name}\n"
-                help_text += "\n"
-
-            # Available Teams section
-            if self.config.teams:
-                help_text += "**Available Teams:**\n"
-                for team_id, team in self.config.teams.items():
-                    desc = team.description if team.description else team.name
-                    help_text += f"• `@{team_id}` - {desc}\n"
-                help_text += "\n"
-
-            # Commands organized by category
-            help_text += "**📋 CC Commands (Productivity):**\n"
-            help_text += "• `/morning` or `/briefing` - Daily briefing\n"
-            help_text += "• `/emails` - Check unread emails\n"
-            help_text += "• `/calendar` - Today's schedule\n"
-            help_text += "• `/meeting` - Next meeting details\n\n"
-
-            help_text += "**💼 Job Hunter Commands:**\n"
-            help_text += "• `/jobs [optional query]` - Search jobs\n"
-            help_text += "• `/jobsearch <query>` - Custom job search\n"
-            help_text += "  Example: `/jobsearch Java Developer at TCS`\n"
-            help_text += "• `/trackjobs` - View tracked jobs\n"
-            help_text += "• `/applications` - View your applications\n\n"
-
-            help_text += "**📋 Feedback Management Commands:**\n"
-            help_text += "• `/submitfeedback <text>` - Submit user feedback\n"
-            help_text += "  Example: `/submitfeedback App is slow`\n"
-            help_text += "• `/clusterfeedback` - Group feedback by theme\n"
-            help_text += "• `/trackbugs` - Create bugs from clusters\n"
-            help_text += "• `/generatesolutions` - Generate PRDs & solutions\n"
-            help_text += "• `/feedbackreport` - Analytics report\n\n"
-
-            help_text += "**🔧 System Commands:**\n"
-            help_text += "• `/agents` - List all agents\n"
-            help_text += "• `/teams` - List all teams\n"
-            help_text += "• `/status` - System status\n"
-            help_text += "• `/research` - Latest AI research\n\n"
+        Workers still running after SHUTDOWN_TIMEOUT are cancelled; their
+        unsent files stay queued and are delivered on the next start.
+        """
+        if not self._chat_workers:
+            return
+        _, pending = await asyncio.wait(self._chat_workers, timeout=SHUTDOWN_TIMEOUT)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
 
-            # Usage examples
-            help_text += "**Or talk directly:**\n"
-            help_text += "`@cc Good morning briefing`\n"
-            help_text += "`@job_hunter Find ML Engineer roles`\n"
-            help_text += "`@researcher What's new in AI?`\n\n"
-            help_text += "✅ Your agency is running!"
-        else:
-            # Fallback help if config not provided
-            help_text = """
-**Available Commands:**
+    async def _run_io(self, func, *args):
+        """Run a blocking queue operation on the I/O executor"""
+        return await asyncio.get_running_loop().run_in_executor(self._io_executor, func, *args)
 
-• `/start` - Start the bot
-• `/help` - Show this help message
+    async def _enqueue(self, message_data: MessageData) -> Path:
+        """
+        Write a message to the incoming queue without blocking the event loop.
 
-**How to talk to agents:**
+        Messages enqueued in the same loop iteration are written together by a
+        single executor job (see _flush_pending).
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((message_data, future))
+        if len(self._pending) == 1:
+            loop.call_soon(self._flush_pending)
+        return await future
+
+    def _flush_pending(self):
+        """Hand the messages collected this loop iteration to the I/O executor"""
+        batch, self._pending = self._pending, []
+        # Per-message results, so one failed write only fails its own sender
+        write = asyncio.get_running_loop().run_in_executor(
+            self._io_executor,
+            partial(
+                self.queue.enqueue_many, [md for md, _ in batch], "incoming", return_exceptions=True
+            ),
+        )
 
-Use `@agent_id` to route messages:
-```
-@researcher What's new in AI?
-@social Post a tweet about AI trends
-@writer Draft a newsletter
-```
+        def resolve(write):
+            error = None if write.cancelled() else write.exception()
+            for i, (_, future) in enumerate(batch):
+                if future.done():
+                    continue
+                if write.cancelled():
+                    future.cancel()
+                elif error is not None:
+                    future.set_exception(error)
+                elif isinstance(write.result()[i], Exception):
+                    future.set_exception(write.result()[i])
+                else:
+                    future.set_result(write.result()[i])
+
+        write.add_done_callback(resolve)
+
+    async def _require_agent(self, msg, agent_id: str) -> bool:
+        """Reply with a hint and return False if a command's agent isn't configured"""
+        if self._agents_set is None or agent_id in self._agents_set:
+            return True
+
+        label = AGENT_LABELS.get(agent_id, agent_id)
+        await msg.reply_text(
+            f"⚠️ {label} agent not configured. Use /agents to see available agents."
+        )
+        return False
+
+    def _message_from_template(self, command: str, msg, user) -> MessageData:
+        """Clone a shortcut command template with the per-request fields filled in"""
+        return replace(
+            self._templates[command],
+            sender=_sender_name(user),
+            sender_id=_sender_id(user.id),
+            timestamp=time.time(),
+            message_id=str(msg.message_id),
+            metadata=_chat_metadata(msg.chat_id, user.id),
+        )
 
-Just message me naturally with an @mention!
-"""
+    def _message_from_update(self, msg, user, text: str, metadata: Optional[dict] = None) -> MessageData:
+        """
+        Build an incoming message carrying text on behalf of user.
 
-        await update.message.reply_text(help_text)
+        Handlers resolve the update's message and user once and pass them in.
+        """
+        return MessageData(
+            channel="telegram",
+            sender=_sender_name(user),
+            sender_id=_sender_id(user.id),
+            message=text,
+            timestamp=time.time(),
+            message_id=str(msg.message_id),
+            metadata=metadata or _chat_metadata(msg.chat_id, user.id),
+        )
 
-    async def _handle_status(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /status command - show system status"""
-        status_text = "📊 **Agency Status**\n\n"
+    def _make_handler(self, command: str):
+        """Build the handler for a shortcut command in COMMAND_TEMPLATES"""
+        agent_id, _, reply = COMMAND_TEMPLATES[command]
+        reply = _strip_md(reply)
 
-        if self.config:
-            status_text += f"✅ **Running**\n\n"
-            status_text += f"**Agents:** {len(self.config.agents)}\n"
-            status_text += f"**Teams:** {len(self.config.teams)}\n"
-            status_text += f"**Queue:** {self.queue.queue_path}\n\n"
-            status_text += "Use /agents or /teams to see details."
-        else:
-            status_text += "⚠️ Configuration not loaded\n"
-            status_text += "Agency may be running with limited functionality."
+        async def handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
+            user = update.effective_user
+            msg = update.message
+            if agent_id and not await self._require_agent(msg, agent_id):
+                return
 
-        await update.message.reply_text(status_text)
+            message_data = self._message_from_template(command, msg, user)
+            logger.info("/%s requested by %s", command, user.username)
+            await self._enqueue(message_data)
+            await msg.reply_text(reply)
 
-    async def _handle_agents(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /agents command - list all agents with details"""
-        if not self.config or not self.config.agents:
-            await update.message.reply_text("⚠️ No agents configured")
-            return
+        return handler
 
-        agents_text = "👥 **Available Agents**\n\n"
+    async def _handle_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /start command"""
+        user = update.effective_user
+        await update.message.reply_text(f"👋 Hi {user.first_name}!\n\n" + _MSG_START)
 
-        for agent_id, agent in self.config.agents.items():
-            agents_text += f"**@{agent_id}** - {agent.name}\n"
-            agents_text += f"_{agent.provider} / {agent.model}_\n"
+    async def _handle_help(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /help command - dynamically generated from agency config"""
+        await update.message.reply_text(self._help_text)
 
-            # Add first sentence of personality as description
-            if agent.personality:
-                desc = agent.personality.split('.')[0] + '.'
-                agents_text += f"{desc}\n"
+    def _build_help_text(self) -> str:
+        """Build the /help reply from the agency config (fixed for the bot's lifetime)"""
+        if not self.config:
+            # Fallback help if config not provided
+            return _MSG_FALLBACK_HELP
+
+        parts = ["🤖 **Agency - Your AI Assistant Team**\n\n"]
+
+        # Available Agents section
+        if self.config.agents:
+            parts.append("**Available Agents:**\n")
+            for agent_id, agent in self.config.agents.items():
+                parts.append(f"• `@{agent_id}` - {agent.name}\n")
+            parts.append("\n")
+
+        # Available Teams section
+        if self.config.teams:
+            parts.append("**Available Teams:**\n")
+            for team_id, team in self.config.teams.items():
+                desc = team.description if team.description else team.name
+                parts.append(f"• `@{team_id}` - {desc}\n")
+            parts.append("\n")
+
+        # Commands organized by category
+        parts.append(
+            "**📋 CC Commands (Productivity):**\n"
+            "• `/morning` or `/briefing` - Daily briefing\n"
+            "• `/emails` - Check unread emails\n"
+            "• `/calendar` - Today's schedule\n"
+            "• `/meeting` - Next meeting details\n\n"
+
+            "**💼 Job Hunter Commands:**\n"
+            "• `/jobs [optional query]` - Search jobs\n"
+            "• `/jobsearch <query>` - Custom job search\n"
+            "  Example: `/jobsearch Java Developer at TCS`\n"
+            "• `/trackjobs` - View tracked jobs\n"
+            "• `/applications` - View your applications\n\n"
+
+            "**📋 Feedback Management Commands:**\n"
+            "• `/submitfeedback <text>` - Submit user feedback\n"
+            "  Example: `/submitfeedback App is slow`\n"
+            "• `/clusterfeedback` - Group feedback by theme\n"
+            "• `/trackbugs` - Create bugs from clusters\n"
+            "• `/generatesolutions` - Generate PRDs & solutions\n"
+            "• `/feedbackreport` - Analytics report\n\n"
+
+            "**🔧 System Commands:**\n"
+            "• `/agents` - List all agents\n"
+            "• `/teams` - List all teams\n"
+            "• `/status` - System status\n"
+            "• `/research` - Latest AI research\n\n"
 
-            agents_text += "\n"
+            # Usage examples
+            "**Or talk directly:**\n"
+            "`@cc Good morning briefing`\n"
+            "`@job_hunter Find ML Engineer roles`\n"
+            "`@researcher What's new in AI?`\n\n"
+            "✅ Your agency is running!"
+        )
 
-        agents_text += "💡 **Usage:** `@agent_id your message`"
+        return _strip_md("".join(parts))
 
-        await update.message.reply_text(agents_text)
+    async def _handle_status(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /status command - show system status"""
+        await update.message.reply_text(self._status_text)
+
+    async def _handle_agents(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /agents command - list all agents with details"""
+        await update.message.reply_text(self._agents_text)
 
     async def _handle_teams(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /teams command - list all teams with details"""
-        if not self.config or not self.config.teams:
-            await update.message.reply_text("⚠️ No teams configured")
-            return
-
-        teams_text = "👨‍👩‍👧‍👦 **Available Teams**\n\n"
-
-        for team_id, team in self.config.teams.items():
-            teams_text += f"**@{team_id}** - {team.name}\n"
-            teams_text += f"_Leader: {team.leader_agent}_\n"
-
-            if team.description:
-                teams_text += f"{team.description}\n"
-
-            teams_text += f"**Members:** {', '.join(team.agents)}\n\n"
+        await update.message.reply_text(self._teams_text)
 
-        teams_text += "💡 **Usage:** `@team_id your message`"
+    def _build_status_text(self) -> str:
+        """Build the /status reply"""
+        parts = ["📊 **Agency Status**\n\n"]
 
-        await update.message.reply_text(teams_text)
-
-    async def _handle_briefing(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /briefing or /morning command - shortcut for @cc daily briefing"""
-        user = update.effective_user
-
-        # Check if cc agent exists
-        if self.config and "cc" not in self.config.agents:
-            await update.message.reply_text(
-                "⚠️ CC agent not configured. Use /agents to see available agents."
+        if self.config:
+            parts.append(
+                "✅ **Running**\n\n"
+                f"**Agents:** {len(self.config.agents)}\n"
+                f"**Teams:** {len(self.config.teams)}\n"
+                f"**Queue:** {self.queue.queue_path}\n\n"
+                "Use /agents or /teams to see details."
+            )
+        else:
+            parts.append(
+                "⚠️ Configuration not loaded\n"
+                "Agency may be running with limited functionality."
             )
-            return
 
-        # Create message data for @cc briefing
-        message_data = MessageData(
-            channel="telegram",
-            sender=user.username or user.first_name,
-            sender_id=str(user.id),
-            message="@cc Good morning! Please give me a daily briefing with my calendar, emails, and priorities.",
-            timestamp=time.time(),
-            message_id=str(update.message.message_id),
-            metadata={
-                "chat_id": update.effective_chat.id,
-                "user_id": user.id,
-            }
-        )
+        return _strip_md("".join(parts))
 
-        # Enqueue message
-        self.queue.enqueue(message_data, "incoming")
+    def _build_agents_text(self) -> str:
+        """Build the /agents reply"""
+        if not self.config or not self.config.agents:
+            return "⚠️ No agents configured"
 
-        logger.info(f"Briefing requested by {user.username}")
-        await update.message.reply_text("☀️ Good morning! Preparing your daily briefing...")
+        parts = ["👥 **Available Agents**\n\n"]
 
-    async def _handle_emails(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /emails command - get unread emails"""
-        user = update.effective_user
+        for agent_id, agent in self.config.agents.items():
+            parts.append(f"**@{agent_id}** - {agent.name}\n")
+            parts.append(f"{agent.provider} / {agent.model}\n")
 
-        if self.config and "cc" not in self.config.agents:
-            await update.message.reply_text("⚠️ CC agent not configured.")
-            return
+            # Add first sentence of personality as description
+            if agent.short_desc:
+                parts.append(f"{agent.short_desc}\n")
 
-        message_data = MessageData(
-            channel="telegram",
-            sender=user.username or user.first_name,
-            sender_id=str(user.id),
-            message="@cc Show me my unread emails, prioritized by importance.",
-            timestamp=time.time(),
-            message_id=str(update.message.message_id),
-            metadata={
-                "chat_id": update.effective_chat.id,
-                "user_id": user.id,
-            }
-        )
+            parts.append("\n")
 
-        self.queue.enqueue(message_data, "incoming")
-        logger.info(f"Emails requested by {user.username}")
-        await update.message.reply_text("📧 Checking your emails...")
+        parts.append("💡 **Usage:** `@agent_id your message`")
 
-    async def _handle_calendar(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /calendar command - get today's schedule"""
-        user = update.effective_user
+        return _strip_md("".join(parts))
 
-        if self.config and "cc" not in self.config.agents:
-            await update.message.reply_text("⚠️ CC agent not configured.")
-            return
+    def _build_teams_text(self) -> str:
+        """Build the /teams reply"""
+        if not self.config or not self.config.teams:
+            return "⚠️ No teams configured"
 
-        message_data = MessageData(
-            channel="telegram",
-            sender=user.username or user.first_name,
-            sender_id=str(user.id),
-            message="@cc Show me my calendar for today with all meeting details.",
-            timestamp=time.time(),
-            message_id=str(update.message.message_id),
-            metadata={
-                "chat_id": update.effective_chat.id,
-                "user_id": user.id,
-            }
-        )
+        parts = ["👨‍👩‍👧‍👦 **Available Teams**\n\n"]
 
-        self.queue.enqueue(message_data, "incoming")
-        logger.info(f"Calendar requested by {user.username}")
-        await update.message.reply_text("📅 Checking your calendar...")
+        for team_id, team in self.config.teams.items():
+            parts.append(f"**@{team_id}** - {team.name}\n")
+            parts.append(f"Leader: {team.leader_agent}\n")
 
-    async def _handle_next_meeting(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /meeting command - get next meeting details"""
-        user = update.effective_user
+            if team.description:
+                parts.append(f"{team.description}\n")
 
-        if self.config and "cc" not in self.config.agents:
-            await update.message.reply_text("⚠️ CC agent not configured.")
-            return
+            parts.append(f"**Members:** {', '.join(team.agents)}\n\n")
 
-        message_data = MessageData(
-            channel="telegram",
-            sender=user.username or user.first_name,
-            sender_id=str(user.id),
-            message="@cc What's my next meeting? Include attendees, agenda, and any relevant context from emails.",
-            timestamp=time.time(),
-            message_id=str(update.message.message_id),
-            metadata={
-                "chat_id": update.effective_chat.id,
-                "user_id": user.id,
-            }
-        )
+        parts.append("💡 **Usage:** `@team_id your message`")
 
-        self.queue.enqueue(message_data, "incoming")
-        logger.info(f"Next meeting requested by {user.username}")
-        await update.message.reply_text("🔜 Checking your next meeting...")
+        return _strip_md("".join(parts))
 
     async def _handle_jobs(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /jobs command - universal job search with parameters"""
         user = update.effective_user
+        msg = update.message
 
-        # Check if job_hunter agent exists
-        if self.config and "job_hunter" not in self.config.agents:
-            await update.message.reply_text(
-                "⚠️ Job Hunter agent not configured. Use /agents to see available agents."
-            )
+        if not await self._require_agent(msg, "job_hunter"):
             return
 
         # Get optional search parameters from command arguments
@@ -468,502 +840,415 @@ Just message me naturally with an @mention!
             message = "@job_hunter Find new Software Engineer, ML Engineer, and Data Scientist job opportunities at companies like Google, Microsoft, TCS, Wipro, Infosys, and startups."
 
         # Create message data for @job_hunter
-        message_data = MessageData(
-            channel="telegram",
-            sender=user.username or user.first_name,
-            sender_id=str(user.id),
-            message=message,
-            timestamp=time.time(),
-            message_id=str(update.message.message_id),
-            metadata={
-                "chat_id": update.effective_chat.id,
-                "user_id": user.id,
-            }
-        )
-
-        # Enqueue message
-        self.queue.enqueue(message_data, "incoming")
+        message_data = self._message_from_update(msg, user, message)
 
-        logger.info(f"Job search requested by {user.username}: {message}")
-        await update.message.reply_text("💼 Searching for job opportunities across LinkedIn, Indeed, Naukri, and Glassdoor...")
+        logger.info("Job search requested by %s: %s", user.username, message)
+        await self._enqueue(message_data)
+        await msg.reply_text("💼 Searching for job opportunities across LinkedIn, Indeed, Naukri, and Glassdoor...")
 
     async def _handle_job_search(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /jobsearch command - flexible universal job search"""
         user = update.effective_user
+        msg = update.message
 
-        if self.config and "job_hunter" not in self.config.agents:
-            await update.message.reply_text("⚠️ Job Hunter agent not configured.")
+        if not await self._require_agent(msg, "job_hunter"):
             return
 
         # Get search query
         args = context.args
 
         if not args:
-            await update.message.reply_text(
-                "💡 **Job Search Examples:**\n\n"
-                "🔹 `/jobsearch Java Developer at TCS in India`\n"
-                "🔹 `/jobsearch Software Engineer at Wipro`\n"
-                "🔹 `/jobsearch ML Engineer with Python and PyTorch`\n"
-                "🔹 `/jobsearch Product Manager remote`\n"
-                "🔹 `/jobsearch Senior Java Developer 5+ years`\n\n"
-                "Or use: `/jobs` for quick general search!"
-            )
+            await msg.reply_text(_MSG_JOBSEARCH_USAGE)
             return
 
         search_query = " ".join(args)
         message = f"@job_hunter Find {search_query}"
 
-        message_data = MessageData(
-            channel="telegram",
-            sender=user.username or user.first_name,
-            sender_id=str(user.id),
-            message=message,
-            timestamp=time.time(),
-            message_id=str(update.message.message_id),
-            metadata={
-                "chat_id": update.effective_chat.id,
-                "user_id": user.id,
-            }
-        )
-
-        self.queue.enqueue(message_data, "incoming")
-        logger.info(f"Universal job search: {search_query}")
-        await update.message.reply_text(f"🔍 Searching: **{search_query}**\n\nSearching across all job boards...")
-
-    async def _handle_track_jobs(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /trackjobs command - view tracked jobs"""
-        user = update.effective_user
-
-        if self.config and "job_hunter" not in self.config.agents:
-            await update.message.reply_text("⚠️ Job Hunter agent not configured.")
-            return
-
-        message_data = MessageData(
-            channel="telegram",
-            sender=user.username or user.first_name,
-            sender_id=str(user.id),
-            message="@job_hunter Show me all my tracked jobs and their current status.",
-            timestamp=time.time(),
-            message_id=str(update.message.message_id),
-            metadata={
-                "chat_id": update.effective_chat.id,
-                "user_id": user.id,
-            }
-        )
-
-        self.queue.enqueue(message_data, "incoming")
-        logger.info(f"Tracked jobs requested by {user.username}")
-        await update.message.reply_text("📊 Loading your tracked jobs...")
-
-    async def _handle_applications(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /applications command - view job applications"""
-        user = update.effective_user
+        message_data = self._message_from_update(msg, user, message)
 
-        if self.config and "job_hunter" not in self.config.agents:
-            await update.message.reply_text("⚠️ Job Hunter agent not configured.")
-            return
-
-        message_data = MessageData(
-            channel="telegram",
-            sender=user.username or user.first_name,
-            sender_id=str(user.id),
-            message="@job_hunter Show me all my job applications and their current status.",
-            timestamp=time.time(),
-            message_id=str(update.message.message_id),
-            metadata={
-                "chat_id": update.effective_chat.id,
-                "user_id": user.id,
-            }
-        )
-
-        self.queue.enqueue(message_data, "incoming")
-        logger.info(f"Applications requested by {user.username}")
-        await update.message.reply_text("📝 Loading your job applications...")
-
-    async def _handle_research(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /research command - shortcut for @researcher daily research"""
-        user = update.effective_user
-
-        # Check if researcher agent exists
-        if self.config and "researcher" not in self.config.agents:
-            await update.message.reply_text(
-                "⚠️ Researcher agent not configured. Use /agents to see available agents."
-            )
-            return
-
-        # Create message data for @researcher
-        message_data = MessageData(
-            channel="telegram",
-            sender=user.username or user.first_name,
-            sender_id=str(user.id),
-            message="@researcher What's new and interesting in AI today? Check ArXiv, Twitter, Hacker News, and major AI labs.",
-            timestamp=time.time(),
-            message_id=str(update.message.message_id),
-            metadata={
-                "chat_id": update.effective_chat.id,
-                "user_id": user.id,
-            }
-        )
-
-        # Enqueue message
-        self.queue.enqueue(message_data, "incoming")
-
-        logger.info(f"Research requested by {user.username}")
-        await update.message.reply_text("🔬 Researching latest AI developments...")
-
-    async def _handle_proactive(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /proactive command - run proactive check"""
-        user = update.effective_user
-
-        message_data = MessageData(
-            channel="telegram",
-            sender=user.username or user.first_name,
-            sender_id=str(user.id),
-            message="@cc Run a proactive check: 1) Check for meetings in next 30 minutes and prepare brief, 2) Check for urgent/important unread emails, 3) Check for approaching deadlines, 4) Check for calendar conflicts, 5) Identify pending action items from recent emails. Summarize only items that need attention.",
-            timestamp=time.time(),
-            message_id=str(update.message.message_id),
-            metadata={
-                "chat_id": update.effective_chat.id,
-                "user_id": user.id,
-            }
-        )
-
-        self.queue.enqueue(message_data, "incoming")
-        logger.info(f"Proactive check requested by {user.username}")
-        await update.message.reply_text("🤖 Running proactive check...")
-
-    async def _handle_meeting_prep(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /meetingprep command - prepare for next meeting"""
-        user = update.effective_user
-
-        message_data = MessageData(
-            channel="telegram",
-            sender=user.username or user.first_name,
-            sender_id=str(user.id),
-            message="@cc Prepare me for my next meeting (within next 60 minutes). Include: 1) Meeting details (what, when, where, who), 2) Recent emails from/to attendees (last 3 days), 3) Related files in Drive, 4) Previous meeting notes if available, 5) Suggested talking points, 6) Pending action items. Format as a concise meeting prep brief. If no meeting in next hour, show meetings for rest of today.",
-            timestamp=time.time(),
-            message_id=str(update.message.message_id),
-            metadata={
-                "chat_id": update.effective_chat.id,
-                "user_id": user.id,
-            }
-        )
-
-        self.queue.enqueue(message_data, "incoming")
-        logger.info(f"Meeting prep requested by {user.username}")
-        await update.message.reply_text("🔜 Preparing for your next meeting...")
-
-    async def _handle_digest(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /digest command - full daily digest"""
-        user = update.effective_user
-
-        message_data = MessageData(
-            channel="telegram",
-            sender=user.username or user.first_name,
-            sender_id=str(user.id),
-            message="@cc Give me a comprehensive daily digest: 1) Priority inbox (urgent/important emails), 2) Today's full schedule, 3) Next meeting prep, 4) Deadlines this week, 5) Pending action items, 6) Recent files, 7) Smart suggestions. Format with sections and emojis.",
-            timestamp=time.time(),
-            message_id=str(update.message.message_id),
-            metadata={
-                "chat_id": update.effective_chat.id,
-                "user_id": user.id,
-            }
-        )
-
-        self.queue.enqueue(message_data, "incoming")
-        logger.info(f"Daily digest requested by {user.username}")
-        await update.message.reply_text("📊 Generating your daily digest...")
-
-    async def _handle_midday(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /midday command - midday check-in"""
-        user = update.effective_user
-
-        message_data = MessageData(
-            channel="telegram",
-            sender=user.username or user.first_name,
-            sender_id=str(user.id),
-            message="@cc Give me a midday check-in: 1) Time status (meetings so far, remaining meetings, available focus time), 2) New urgent items since morning, 3) Afternoon prep (next meeting details), 4) Quick wins (action items that can be done now). Keep it brief.",
-            timestamp=time.time(),
-            message_id=str(update.message.message_id),
-            metadata={
-                "chat_id": update.effective_chat.id,
-                "user_id": user.id,
-            }
-        )
-
-        self.queue.enqueue(message_data, "incoming")
-        logger.info(f"Midday check requested by {user.username}")
-        await update.message.reply_text("🌞 Midday check-in coming up...")
-
-    async def _handle_eod(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /eod command - end of day summary"""
-        user = update.effective_user
-
-        message_data = MessageData(
-            channel="telegram",
-            sender=user.username or user.first_name,
-            sender_id=str(user.id),
-            message="@cc Give me an end of day summary: 1) Today's accomplishments (meetings, emails handled, tasks done), 2) Inbox status (unread count, urgent pending), 3) Tomorrow's preview (all meetings, time for work, important events), 4) Pending items that didn't get done, 5) Prep needed for tomorrow, 6) Top priority for tomorrow. Format as encouraging wrap-up.",
-            timestamp=time.time(),
-            message_id=str(update.message.message_id),
-            metadata={
-                "chat_id": update.effective_chat.id,
-                "user_id": user.id,
-            }
-        )
-
-        self.queue.enqueue(message_data, "incoming")
-        logger.info(f"EOD summary requested by {user.username}")
-        await update.message.reply_text("🌙 Wrapping up your day...")
+        logger.info("Universal job search: %s", search_query)
+        await self._enqueue(message_data)
+        await msg.reply_text(f"🔍 Searching: {search_query}\n\nSearching across all job boards...")
 
     # ─── Feedback Management Handlers ─────────────────────────────────────────
 
     async def _handle_submit_feedback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /submitfeedback command - submit user feedback"""
         user = update.effective_user
+        msg = update.message
 
         # Get feedback text from args
         if not context.args:
-            await update.message.reply_text(
-                "📝 **Submit Feedback**\n\n"
-                "Usage: `/submitfeedback Your feedback here`\n\n"
-                "Example: `/submitfeedback The app is very slow when loading the dashboard`"
-            )
+            await msg.reply_text(_MSG_FEEDBACK_USAGE)
             return
 
         feedback_text = " ".join(context.args)
 
-        message_data = MessageData(
-            channel="telegram",
-            sender=user.username or user.first_name,
-            sender_id=str(user.id),
-            message=f"@feedback_coordinator Submit this user feedback: '{feedback_text}' - Category: user_report, Severity: medium, User: {user.username or user.first_name}",
-            timestamp=time.time(),
-            message_id=str(update.message.message_id),
+        sender = _sender_name(user)
+        message_data = self._message_from_update(
+            msg,
+            user,
+            f"@feedback_coordinator Submit this user feedback: '{feedback_text}' - Category: user_report, Severity: medium, User: {sender}",
             metadata={
-                "chat_id": update.effective_chat.id,
+                "chat_id": msg.chat_id,
                 "user_id": user.id,
                 "feedback_type": "telegram_command"
             }
         )
 
-        self.queue.enqueue(message_data, "incoming")
-        logger.info(f"Feedback submitted by {user.username}: {feedback_text[:50]}...")
-        await update.message.reply_text(
-            "✅ **Feedback Submitted!**\n\n"
+        logger.info("Feedback submitted by %s: %s...", user.username, feedback_text[:50])
+        await self._enqueue(message_data)
+        await msg.reply_text(
+            "✅ Feedback Submitted!\n\n"
             f"📝 {feedback_text}\n\n"
             "The feedback team will analyze and cluster this with similar reports. "
             "Thank you for helping us improve!"
         )
 
-    async def _handle_cluster_feedback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /clusterfeedback command - cluster feedback into themes"""
-        user = update.effective_user
-
-        message_data = MessageData(
-            channel="telegram",
-            sender=user.username or user.first_name,
-            sender_id=str(user.id),
-            message="@feedback_team Run the cluster-feedback skill to group all new feedback reports into themes. Identify patterns, create clusters with high-level themes, perform root cause analysis, and report on the clusters created.",
-            timestamp=time.time(),
-            message_id=str(update.message.message_id),
-            metadata={
-                "chat_id": update.effective_chat.id,
-                "user_id": user.id,
-            }
-        )
-
-        self.queue.enqueue(message_data, "incoming")
-        logger.info(f"Cluster feedback requested by {user.username}")
-        await update.message.reply_text(
-            "🎯 **Clustering Feedback...**\n\n"
-            "Analyzing feedback reports and grouping by theme...\n"
-            "This may take a moment."
-        )
-
-    async def _handle_track_bugs(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /trackbugs command - track bugs from feedback clusters"""
-        user = update.effective_user
-
-        message_data = MessageData(
-            channel="telegram",
-            sender=user.username or user.first_name,
-            sender_id=str(user.id),
-            message="@feedback_team Run the track-bugs skill to create bugs from feedback clusters and post updates on existing bugs when new related reports arrive. Report on bugs created and updated.",
-            timestamp=time.time(),
-            message_id=str(update.message.message_id),
-            metadata={
-                "chat_id": update.effective_chat.id,
-                "user_id": user.id,
-            }
-        )
-
-        self.queue.enqueue(message_data, "incoming")
-        logger.info(f"Track bugs requested by {user.username}")
-        await update.message.reply_text(
-            "🐛 **Tracking Bugs...**\n\n"
-            "Creating and updating bug reports from feedback clusters..."
-        )
+    # ──────────────────────────────────────────────────────────────────────────
 
-    async def _handle_generate_solutions(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /generatesolutions command - generate PRDs and solutions"""
+    async def _handle_unauthorized(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Reject messages from users outside allowed_users"""
         user = update.effective_user
-
-        message_data = MessageData(
-            channel="telegram",
-            sender=user.username or user.first_name,
-            sender_id=str(user.id),
-            message="@feedback_team Run the generate-solutions skill to create comprehensive solutions for all open bugs. Include PRDs (Product Requirement Documents), coding agent prompts, trade-off analysis, and effort estimates. Report on solutions generated.",
-            timestamp=time.time(),
-            message_id=str(update.message.message_id),
-            metadata={
-                "chat_id": update.effective_chat.id,
-                "user_id": user.id,
-            }
-        )
-
-        self.queue.enqueue(message_data, "incoming")
-        logger.info(f"Generate solutions requested by {user.username}")
+        logger.warning("Unauthorized user: %s (%s)", user.id, user.username)
         await update.message.reply_text(
-            "💡 **Generating Solutions...**\n\n"
-            "Creating PRDs, prototypes, and coding prompts for bugs...\n"
-            "This will include trade-offs and effort estimates."
+            "Sorry, you're not authorized to use this bot. "
+            "Contact the administrator to get access."
         )
 
-    async def _handle_feedback_report(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /feedbackreport command - get analytics report"""
-        user = update.effective_user
-
-        message_data = MessageData(
-            channel="telegram",
-            sender=user.username or user.first_name,
-            sender_id=str(user.id),
-            message="@feedback_team Run the feedback-report skill to generate a comprehensive analytics report. Include: total feedback count, status breakdown, top issues by feedback count, trend analysis, bug statistics, and solution progress. Present in a clear, formatted summary.",
-            timestamp=time.time(),
-            message_id=str(update.message.message_id),
-            metadata={
-                "chat_id": update.effective_chat.id,
-                "user_id": user.id,
-            }
-        )
-
-        self.queue.enqueue(message_data, "incoming")
-        logger.info(f"Feedback report requested by {user.username}")
-        await update.message.reply_text(
-            "📊 **Generating Feedback Report...**\n\n"
-            "Analyzing system-wide feedback metrics, trends, and top issues..."
-        )
-
-    # ──────────────────────────────────────────────────────────────────────────
-
     async def _handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle incoming messages"""
         user = update.effective_user
-        message_text = update.message.text
-
-        # Check if user is allowed
-        if self.allowed_users and str(user.id) not in self.allowed_users:
-            logger.warning(f"Unauthorized user: {user.id} ({user.username})")
-            await update.message.reply_text(
-                "Sorry, you're not authorized to use this bot. "
-                "Contact the administrator to get access."
+        msg = update.message
+        message_text = msg.text
+
+        # The processor drops messages without a known @agent/@team prefix, so
+        # reject those here instead of acknowledging and queueing them
+        target_id, _ = router.parse_agent_routing(message_text)
+        if target_id is None:
+            await msg.reply_text(_MSG_NO_TARGET)
+            return
+        if self._targets is not None and target_id not in self._targets:
+            await msg.reply_text(
+                f"⚠️ Unknown agent or team: @{target_id}. Use /agents or /teams to see what's available."
             )
             return
 
         # Create message data
-        message_data = MessageData(
-            channel="telegram",
-            sender=user.username or user.first_name,
-            sender_id=str(user.id),
-            message=message_text,
-            timestamp=time.time(),
-            message_id=str(update.message.message_id),
-            metadata={
-                "chat_id": update.effective_chat.id,
-                "user_id": user.id,
-            }
-        )
+        message_data = self._message_from_update(msg, user, message_text)
+
+        logger.info("Received message from %s: %s", user.username, message_text[:50])
 
-        # Enqueue message
-        self.queue.enqueue(message_data, "incoming")
+        # Enqueue message, then acknowledge it (only once it is safely queued)
+        await self._enqueue(message_data)
+        await self._send_typing(msg.chat_id)
 
-        logger.info(f"Received message from {user.username}: {message_text[:50]}")
+    async def _send_typing(self, chat_id: int):
+        """
+        Acknowledge a queued message with a "typing…" indicator.
 
-        # Send acknowledgment
-        await update.message.reply_text("✓ Message received, processing...")
+        A chat action is lighter than a reply message, and a burst of messages
+        shares one indicator: it is re-sent at most once per TYPING_INTERVAL.
+        """
+        now = time.monotonic()
+        last = self._typing_sent.get(chat_id)
+        if last is not None and now - last < TYPING_INTERVAL:
+            return
+
+        # Entries are re-inserted on every send, so the dict stays ordered by
+        # send time and expired chats are dropped from the front; it only
+        # holds chats active within the last TYPING_INTERVAL
+        self._typing_sent.pop(chat_id, None)
+        while self._typing_sent:
+            oldest = next(iter(self._typing_sent))
+            if now - self._typing_sent[oldest] < TYPING_INTERVAL:
+                break
+            del self._typing_sent[oldest]
+        self._typing_sent[chat_id] = now
+        try:
+            await self.app.bot.send_chat_action(chat_id=chat_id, action=ChatAction.TYPING)
+        except Exception as e:
+            logger.warning("Failed to send typing action to chat %s: %s", chat_id, e)
 
     async def _poll_outgoing(self):
         """Poll outgoing queue and send responses to Telegram"""
         logger.info("Starting outgoing queue poller...")
 
+        error_delay = POLL_INTERVAL
+        full_scan = True
+        last_full_scan = 0.0
+
         while True:
             try:
-                # Check outgoing queue
-                for queued_message in self.queue.iter_outgoing():
+                now = time.time()
+
+                # Scan the whole directory at startup, on the safety timer, when a
+                # retry falls due or without inotify; otherwise only read the
+                # files the watcher reported. The safety timer is checked here
+                # too, since steady watcher events keep the wait from timing out.
+                if (full_scan or now - last_full_scan >= RESCAN_INTERVAL
+                        or self._retry_at <= now or not self._watching_outgoing):
+                    self._outgoing_changed.clear()
+                    self._retry_at = float("inf")
+                    last_full_scan = now
+                    candidates = await self._run_io(self._read_pending, None, frozenset(self._in_flight))
+                else:
+                    changed, self._outgoing_changed = self._outgoing_changed, set()
+                    candidates = await self._run_io(
+                        self._read_pending, sorted(changed, key=lambda p: FileQueue.order_key(p.name)),
+                        frozenset(self._in_flight)
+                    )
+
+                # Hand due messages to per-chat workers: different chats are
+                # sent to concurrently, while each chat gets its responses in order
+                for queued_message in candidates:
                     if queued_message.data.channel != "telegram":
                         continue
 
+                    # Already handed to a chat worker on an earlier scan
+                    if queued_message.path in self._in_flight:
+                        continue
+
+                    # Skip messages still backing off from a failed send
+                    metadata = queued_message.data.metadata
+                    next_attempt_at = metadata.get("next_attempt_at", 0)
+                    if next_attempt_at > now:
+                        self._retry_at = min(self._retry_at, next_attempt_at)
+                        continue
+
                     # Get chat ID from metadata
-                    chat_id = queued_message.data.metadata.get("chat_id")
+                    chat_id = metadata.get("chat_id")
                     if not chat_id:
                         logger.error("No chat_id in message metadata")
-                        self.queue.delete_outgoing(queued_message.path)
+                        await self._run_io(self.queue.delete_outgoing, queued_message.path)
                         continue
 
-                    # Send response
-                    try:
-                        message_text = queued_message.data.message
-                        logger.info(f"📤 Sending response to chat {chat_id}: {repr(message_text[:100])}")
-
-                        # Telegram has a 4096 character limit - split if needed
-                        MAX_LENGTH = 4000  # Leave some margin
-                        if len(message_text) <= MAX_LENGTH:
-                            # Send as single message
-                            await self.app.bot.send_message(
-                                chat_id=chat_id,
-                                text=message_text
-                            )
-                            logger.info(f"✅ Sent response to chat {chat_id} ({len(message_text)} chars)")
-                        else:
-                            # Split into chunks
-                            chunks = []
-                            current_chunk = ""
-
-                            for line in message_text.split('\n'):
-                                if len(current_chunk) + len(line) + 1 <= MAX_LENGTH:
-                                    current_chunk += line + '\n'
-                                else:
-                                    if current_chunk:
-                                        chunks.append(current_chunk.strip())
-                                    current_chunk = line + '\n'
-
-                            if current_chunk:
-                                chunks.append(current_chunk.strip())
-
-                            # Send chunks
-                            for i, chunk in enumerate(chunks, 1):
-                                header = f"📄 Part {i}/{len(chunks)}\n\n" if len(chunks) > 1 else ""
-                                await self.app.bot.send_message(
-                                    chat_id=chat_id,
-                                    text=header + chunk
-                                )
-                                await asyncio.sleep(0.5)  # Rate limiting
-
-                            logger.info(f"✅ Sent response to chat {chat_id} ({len(message_text)} chars in {len(chunks)} parts)")
-
-                        # Delete from outgoing queue
-                        self.queue.delete_outgoing(queued_message.path)
-
-                    except Exception as e:
-                        logger.error(f"Error sending message to Telegram: {e}")
-                        # Don't delete - will retry
-
-                # Sleep briefly
-                await asyncio.sleep(0.5)
+                    self._dispatch(chat_id, queued_message)
+
+                # Wait for new responses (or the next retry that falls due)
+                error_delay = POLL_INTERVAL
+                idle_delay = RESCAN_INTERVAL if self._watching_outgoing else POLL_INTERVAL
+                wake_at = min(now + idle_delay, self._retry_at)
+                full_scan = not await self._wait_for_outgoing(wake_at - time.time())
+
+            except Exception as e:
+                logger.error("Error in outgoing poller: %s", e, exc_info=True)
+                full_scan = True
+                await asyncio.sleep(error_delay)
+                error_delay = min(error_delay * 2, MAX_POLL_ERROR_DELAY)
+
+    def _read_pending(self, paths: Optional[list], in_flight: frozenset) -> list:
+        """
+        Load outgoing messages not already held by a chat worker (runs on the
+        I/O executor).
+
+        Args:
+            paths: Files to read, or None to list the whole outgoing queue
+            in_flight: Paths to skip without reading
+        """
+        if paths is None:
+            paths = self.queue.list_outgoing("telegram")
+
+        unreadable = []
+        messages = list(self.queue.read_outgoing_many(
+            [p for p in paths if p not in in_flight and not self._still_unreadable(p)],
+            unreadable,
+        ))
 
+        # Remember bad files so each rescan doesn't parse (and log) them again
+        for path in unreadable:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            self._unreadable[path] = (stat.st_mtime_ns, stat.st_size)
+        return messages
+
+    def _still_unreadable(self, path: Path) -> bool:
+        """True if path failed to parse before and hasn't changed since (runs on the I/O executor)"""
+        stamp = self._unreadable.get(path)
+        if stamp is None:
+            return False
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            del self._unreadable[path]
+            return True
+        if (stat.st_mtime_ns, stat.st_size) == stamp:
+            return True
+        # Rewritten (e.g. a write that was still in progress): try it again
+        del self._unreadable[path]
+        return False
+
+    def _dispatch(self, chat_id: int, queued_message):
+        """Queue a response on its chat's worker, starting one if the chat is idle"""
+        self._in_flight.add(queued_message.path)
+        queue = self._chat_queues.get(chat_id)
+        if queue is None:
+            queue = self._chat_queues[chat_id] = asyncio.Queue()
+            worker = asyncio.create_task(self._chat_worker(chat_id, queue))
+            self._chat_workers.add(worker)
+            worker.add_done_callback(self._chat_workers.discard)
+        queue.put_nowait(queued_message)
+
+    async def _chat_worker(self, chat_id: int, queue: asyncio.Queue):
+        """Send one chat's responses in order, exiting once its queue is drained"""
+        while not queue.empty():
+            queued_message = queue.get_nowait()
+            try:
+                # Sent and deleted since the scan that dispatched it
+                if not queued_message.path.exists():
+                    continue
+                # On flood control, pause this chat (without holding a send
+                # slot) and resume the same message so its order is kept; if
+                # that keeps happening, fall back to the regular retry backoff
+                for attempt in range(MAX_FLOOD_WAITS + 1):
+                    async with self._send_slots:
+                        retry_after = await self._send_outgoing(chat_id, queued_message)
+                    if retry_after is None:
+                        break
+                    if attempt == MAX_FLOOD_WAITS:
+                        await self._schedule_retry(queued_message, min_delay=retry_after)
+                        break
+                    await asyncio.sleep(retry_after)
             except Exception as e:
-                logger.error(f"Error in outgoing poller: {e}", exc_info=True)
-                await asyncio.sleep(1)
+                logger.error("Error in chat %s sender: %s", chat_id, e, exc_info=True)
+            finally:
+                self._in_flight.discard(queued_message.path)
+
+        del self._chat_queues[chat_id]
+
+    async def _send_outgoing(self, chat_id: int, queued_message) -> Optional[float]:
+        """
+        Send one queued response, then delete it or schedule a retry.
+
+        Parts of a split message that Telegram accepted are counted in the
+        "parts_sent" metadata, so a later attempt resumes after them instead
+        of delivering them twice.
+
+        Returns:
+            Seconds Telegram asked us to wait if the chat is flood-limited
+            (the message is left queued as is), otherwise None
+        """
+        metadata = queued_message.data.metadata
+        try:
+            message_text = queued_message.data.message
+            logger.info("📤 Sending response to chat %s: %r", chat_id, message_text[:100])
+
+            # Telegram has a 4096 character limit - split if needed
+            if len(message_text) <= MAX_MESSAGE_LENGTH:
+                parts = [message_text]
+            else:
+                chunks = _split_message(message_text, MAX_MESSAGE_LENGTH)
+                parts = [
+                    f"📄 Part {i}/{len(chunks)}\n\n{chunk}" if len(chunks) > 1 else chunk
+                    for i, chunk in enumerate(chunks, 1)
+                ]
+
+            for i in range(metadata.get("parts_sent", 0), len(parts)):
+                await self.app.bot.send_message(
+                    chat_id=chat_id,
+                    text=parts[i]
+                )
+                metadata["parts_sent"] = i + 1
+
+            logger.info("✅ Sent response to chat %s (%s chars in %s parts)", chat_id, len(message_text), len(parts))
+
+            # Delete from outgoing queue
+            await self._run_io(self.queue.delete_outgoing, queued_message.path)
+
+        except RetryAfter as e:
+            retry_after = e.retry_after
+            if hasattr(retry_after, "total_seconds"):  # timedelta in newer PTB
+                retry_after = retry_after.total_seconds()
+            logger.warning("Flood control for chat %s, waiting %ss", chat_id, retry_after)
+            return retry_after
+
+        except Exception as e:
+            logger.error("Error sending message to Telegram: %s", e)
+            await self._schedule_retry(queued_message)
+
+        return None
+
+    async def _wait_for_outgoing(self, timeout: float) -> bool:
+        """
+        Sleep until the watcher reports a new outgoing file or timeout expires.
+
+        Returns:
+            True if woken by the watcher, False on timeout
+        """
+        try:
+            await asyncio.wait_for(self._outgoing_ready.wait(), max(timeout, 0))
+            woken = True
+        except asyncio.TimeoutError:
+            woken = False
+        self._outgoing_ready.clear()
+        return woken
+
+    async def _watch_outgoing(self):
+        """Wake the outgoing poller whenever a response is written to the queue"""
+        try:
+            with Inotify() as inotify:
+                inotify.add_watch(self.queue.outgoing, Mask.CLOSE_WRITE | Mask.MOVED_TO)
+                self._watching_outgoing = True
+                logger.info("Watching outgoing queue with inotify")
+
+                async for event in inotify:
+                    if event.name:
+                        self._note_outgoing(self.queue.outgoing / event.name)
+        except OSError as e:
+            logger.warning("inotify unavailable, polling outgoing queue instead: %s", e)
+        finally:
+            self._watching_outgoing = False
+
+    async def _watch_outgoing_portable(self):
+        """watchfiles-based _watch_outgoing for platforms without inotify (macOS, Windows)"""
+        self._watching_outgoing = True
+        logger.info("Watching outgoing queue with watchfiles")
+        try:
+            async for changes in awatch(self.queue.outgoing, recursive=False, stop_event=self._stop_event):
+                for change, path in changes:
+                    if change != Change.deleted:
+                        self._note_outgoing(Path(path))
+        except OSError as e:
+            logger.warning("watchfiles unavailable, polling outgoing queue instead: %s", e)
+        finally:
+            self._watching_outgoing = False
+
+    def _note_outgoing(self, path: Path):
+        """Record a Telegram response file reported by a watcher and wake the poller"""
+        if path.suffix == ".json" and FileQueue.channel_of(path) in ("telegram", None):
+            self._outgoing_changed.add(path)
+            self._outgoing_ready.set()
+
+    async def _schedule_retry(self, queued_message, min_delay: float = 0):
+        """
+        Back off a failed outgoing message, dead-lettering it after too many attempts.
+
+        Retry state lives in the message metadata so it survives restarts.
+
+        Args:
+            queued_message: Message whose send failed
+            min_delay: Shortest acceptable backoff, e.g. Telegram's retry_after
+        """
+        metadata = queued_message.data.metadata
+        retry_count = metadata.get("retry_count", 0) + 1
+
+        if retry_count > MAX_SEND_RETRIES:
+            logger.error("Giving up on %s after %s retries", queued_message.path.name, MAX_SEND_RETRIES)
+            await self._run_io(self.queue.move_to_dead_letter, queued_message.path)
+            return
+
+        delay = max(min(MAX_RETRY_DELAY, 2 ** retry_count), min_delay)
+        metadata["retry_count"] = retry_count
+        metadata["next_attempt_at"] = time.time() + delay
+        await self._run_io(self.queue.update_outgoing, queued_message.path, queued_message.data)
+        logger.warning("Retry %s/%s for %s in %ss", retry_count, MAX_SEND_RETRIES, queued_message.path.name, delay)
+
+        # The watcher event for the rewrite is skipped while the file is in
+        # flight, so tell the poller directly when to pick it up again
+        self._retry_at = min(self._retry_at, metadata["next_attempt_at"])
+        self._outgoing_ready.set()
 
 
 def main():
@@ -988,14 +1273,18 @@ def main():
         sys.exit(1)
 
     allowed_users_str = os.getenv("TELEGRAM_ALLOWED_USERS", "")
-    allowed_users = [u.strip() for u in allowed_users_str.split(",") if u.strip()]
+    try:
+        allowed_users = [int(u) for u in allowed_users_str.split(",") if u.strip()]
+    except ValueError:
+        logger.error("TELEGRAM_ALLOWED_USERS must be comma-separated numeric user IDs")
+        sys.exit(1)
 
     # Load agency config for dynamic help
     try:
         agency_config = load_config()
-        logger.info(f"Loaded agency config: {len(agency_config.agents)} agents, {len(agency_config.teams)} teams")
+        logger.info("Loaded agency config: %s agents, %s teams", len(agency_config.agents), len(agency_config.teams))
     except Exception as e:
-        logger.warning(f"Could not load agency config: {e}. Help will use fallback.")
+        logger.warning("Could not load agency config: %s. Help will use fallback.", e)
         agency_config = None
 
     # Create queue (use default path)
@@ -1010,8 +1299,14 @@ def main():
         config=agency_config
     )
 
-    # Run
-    asyncio.run(channel.start())
+    # Run on uvloop when available (faster libuv-based event loop). uvloop.run
+    # replaces the deprecated uvloop.install() global policy switch.
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(channel.start())
+    else:
+        uvloop.run(channel.start())
 
 
 if __name__ == '__main__':
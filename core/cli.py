@@ -20,10 +20,58 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Command -> (handler class in core.cli_commands, method name)
+_DISPATCH = {
+    'start': ('CoreCommands', 'start'),
+    'stop': ('CoreCommands', 'stop'),
+    'status': ('CoreCommands', 'status'),
+    'logs': ('CoreCommands', 'logs'),
+    'version': ('CoreCommands', 'version'),
+    'web': ('CoreCommands', 'web'),
+    'init': ('CoreCommands', 'init'),
+
+    'agent': ('AgentCommands', 'handle'),
+    'team': ('TeamCommands', 'handle'),
+    'config': ('ConfigCommands', 'handle'),
+
+    'pair': ('PairingCommands', 'pair'),
+    'unpair': ('PairingCommands', 'unpair'),
+    'list-pairings': ('PairingCommands', 'list_pairings'),
+
+    'update': ('UpdateCommands', 'update'),
+    'check-updates': ('UpdateCommands', 'check_updates'),
+
+    'send': ('MessagingCommands', 'send'),
+    'broadcast': ('MessagingCommands', 'broadcast'),
+    'history': ('MessagingCommands', 'history'),
+
+    'debug': ('DebugCommands', None),
+}
+
+# debug subcommand -> DebugCommands method name
+_DEBUG_DISPATCH = {
+    'visualize': 'visualize',
+    'check': 'check',
+    'test': 'test',
+}
+
 
 class AgencyCLI:
     """Main CLI handler for Agency"""
 
+    # Parser builders and the top-level commands each registers, in help order
+    _COMMAND_GROUPS = (
+        ('_add_core_commands',
+         ('start', 'stop', 'status', 'logs', 'version', 'web', 'init')),
+        ('_add_agent_commands', ('agent',)),
+        ('_add_team_commands', ('team',)),
+        ('_add_config_commands', ('config',)),
+        ('_add_pairing_commands', ('pair', 'unpair', 'list-pairings')),
+        ('_add_update_commands', ('update', 'check-updates')),
+        ('_add_messaging_commands', ('send', 'broadcast', 'history')),
+        ('_add_debug_commands', ('debug',)),
+    )
+
     def __init__(self):
         self.base_dir = Path.home() / ".agency"
         self.workspace_dir = Path.home() / "agency-workspace"
@@ -48,29 +96,17 @@ For more help: agency <command> --help
 
         subparsers = parser.add_subparsers(dest='command', help='Command to run')
 
-        # Core commands
-        self._add_core_commands(subparsers)
-
-        # Agent commands
-        self._add_agent_commands(subparsers)
-
-        # Team commands
-        self._add_team_commands(subparsers)
-
-        # Configuration commands
-        self._add_config_commands(subparsers)
-
-        # Pairing commands
-        self._add_pairing_commands(subparsers)
-
-        # Update commands
-        self._add_update_commands(subparsers)
-
-        # Messaging commands
-        self._add_messaging_commands(subparsers)
-
-        # Debug commands
-        self._add_debug_commands(subparsers)
+        # Only build the parser group for the requested command; fall back
+        # to the full tree for --help, no command or unknown commands.
+        if args is None:
+            args = sys.argv[1:]
+        command = args[0] if args else None
+        groups = [
+            builder for builder, commands in self._COMMAND_GROUPS
+            if command in commands
+        ] or [builder for builder, _ in self._COMMAND_GROUPS]
+        for builder in groups:
+            getattr(self, builder)(subparsers)
 
         # Parse arguments
         parsed_args = parser.parse_args(args)
@@ -599,74 +635,24 @@ For more help: agency <command> --help
     def _execute_command(self, args):
         """Execute the parsed command"""
         # Import command handlers
-        from core.cli_commands import (
-            CoreCommands,
-            AgentCommands,
-            TeamCommands,
-            ConfigCommands,
-            PairingCommands,
-            UpdateCommands,
-            MessagingCommands,
-            DebugCommands
-        )
+        from core import cli_commands
 
         # Route to appropriate handler
-        if args.command == 'start':
-            return CoreCommands().start(args)
-        elif args.command == 'stop':
-            return CoreCommands().stop(args)
-        elif args.command == 'status':
-            return CoreCommands().status(args)
-        elif args.command == 'logs':
-            return CoreCommands().logs(args)
-        elif args.command == 'version':
-            return CoreCommands().version(args)
-        elif args.command == 'web':
-            return CoreCommands().web(args)
-        elif args.command == 'init':
-            return CoreCommands().init(args)
-
-        elif args.command == 'agent':
-            return AgentCommands().handle(args)
-        elif args.command == 'team':
-            return TeamCommands().handle(args)
-        elif args.command == 'config':
-            return ConfigCommands().handle(args)
-
-        elif args.command == 'pair':
-            return PairingCommands().pair(args)
-        elif args.command == 'unpair':
-            return PairingCommands().unpair(args)
-        elif args.command == 'list-pairings':
-            return PairingCommands().list_pairings(args)
-
-        elif args.command == 'update':
-            return UpdateCommands().update(args)
-        elif args.command == 'check-updates':
-            return UpdateCommands().check_updates(args)
-
-        elif args.command == 'send':
-            return MessagingCommands().send(args)
-        elif args.command == 'broadcast':
-            return MessagingCommands().broadcast(args)
-        elif args.command == 'history':
-            return MessagingCommands().history(args)
-
-        elif args.command == 'debug':
-            debug_cmd = DebugCommands()
-            if args.debug_command == 'visualize':
-                return debug_cmd.visualize(args)
-            elif args.debug_command == 'check':
-                return debug_cmd.check(args)
-            elif args.debug_command == 'test':
-                return debug_cmd.test(args)
-            else:
+        route = _DISPATCH.get(args.command)
+        if route is None:
+            logger.error(f"Unknown command: {args.command}")
+            return 1
+
+        class_name, method_name = route
+        handler = getattr(cli_commands, class_name)()
+
+        if args.command == 'debug':
+            method_name = _DEBUG_DISPATCH.get(args.debug_command)
+            if method_name is None:
                 logger.error(f"Unknown debug command: {args.debug_command}")
                 return 1
 
-        else:
-            logger.error(f"Unknown command: {args.command}")
-            return 1
+        return getattr(handler, method_name)(args)
 
 
 def main():
@@ -4,18 +4,100 @@ Command handlers for Agency CLI.
 Each command group (Core, Agent, Team, etc.) is handled by a separate class.
 """
 
+import codecs
+import heapq
 import os
 import sys
 import json
 import logging
-import subprocess
-import signal
+import re
+import tempfile
+import time
 from pathlib import Path
 from typing import Dict, List, Optional
-from datetime import datetime
+
+try:
+    import orjson
+except ImportError:  # Optional C-accelerated JSON
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+LOG_READ_BLOCK = 8192       # Bytes read per step when scanning a log backwards
+LOG_FOLLOW_INTERVAL = 0.2   # Seconds between checks for new log output
+
+# Commands that run the long-lived Agency processes
+PROCESSOR_CMD = [sys.executable, "-m", "agency.core.processor"]
+TELEGRAM_CMD = [sys.executable, "-m", "agency.channels.telegram_channel"]
+
+# Template written to .env.example by 'agency init'
+_ENV_EXAMPLE = b"""# Agency Configuration
+
+# Required
+ANTHROPIC_API_KEY=sk-ant-...
+
+# Telegram (optional)
+TELEGRAM_BOT_TOKEN=
+TELEGRAM_ALLOWED_USERS=
+
+# Google Services (optional - for CC agent)
+GOOGLE_OAUTH_CREDENTIALS_FILE=google_oauth_credentials.json
+GOOGLE_TOKEN_FILE=google_token.pickle
+
+# Social Media (optional)
+TWITTER_API_KEY=
+TWITTER_API_SECRET=
+TWITTER_ACCESS_TOKEN=
+TWITTER_ACCESS_TOKEN_SECRET=
+
+LINKEDIN_CLIENT_ID=
+LINKEDIN_CLIENT_SECRET=
+"""
+
+# Config keys whose values are masked by 'agency config show'
+_SENSITIVE_KEY = re.compile(r"token|key|secret", re.IGNORECASE)
+
+
+def _read_json(path: Path):
+    """Parse a JSON file (orjson when available)"""
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _write_json(path: Path, data):
+    """Write data as indented UTF-8 JSON (orjson when available)"""
+    if orjson is not None:
+        raw = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        raw = json.dumps(data, indent=2).encode()
+    _write_atomic(path, raw)
+
+
+def _write_atomic(path: Path, raw: bytes):
+    """Replace a file's contents so readers never see a partial file
+
+    The temp file is created 0600 with a unique name, and takes over the
+    existing file's mode, so saving config.json never widens access to the
+    tokens stored in it.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+        try:
+            os.chmod(tmp_name, path.stat().st_mode & 0o7777)
+        except FileNotFoundError:
+            pass  # New file: keep mkstemp's 0600
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
 
 class BaseCommands:
     """Base class for command handlers"""
@@ -27,30 +109,57 @@ class BaseCommands:
         self.agents_file = Path(__file__).parent / "templates" / "agents.json"
         self.pid_file = self.base_dir / "agency.pid"
 
+    def default_config(self) -> Dict:
+        """Configuration written by 'agency init' and 'agency config reset'"""
+        return {
+            "telegram": {
+                "enabled": False,
+                "bot_token": "",
+                "allowed_users": []
+            },
+            "anthropic": {
+                "api_key": os.getenv("ANTHROPIC_API_KEY", "")
+            },
+            "workspace_dir": str(self.workspace_dir),
+            "log_level": "INFO"
+        }
+
     def load_config(self) -> Dict:
         """Load configuration"""
-        if not self.config_file.exists():
+        try:
+            return _read_json(self.config_file)
+        except FileNotFoundError:
             return {}
-        with open(self.config_file) as f:
-            return json.load(f)
 
     def save_config(self, config: Dict):
         """Save configuration"""
         self.base_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        _write_json(self.config_file, config)
 
     def load_agents(self) -> Dict:
         """Load agents configuration"""
-        if not self.agents_file.exists():
+        try:
+            return _read_json(self.agents_file)
+        except FileNotFoundError:
             return {"agents": {}, "teams": {}}
-        with open(self.agents_file) as f:
-            return json.load(f)
 
     def save_agents(self, data: Dict):
         """Save agents configuration"""
-        with open(self.agents_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json(self.agents_file, data)
+
+    def _load_pids(self) -> Dict[str, int]:
+        """Load process PIDs"""
+        try:
+            raw = self.pid_file.read_text()
+            if raw.startswith("{"):
+                # JSON PID file written by an older version
+                return json.loads(raw)
+            return {
+                name: int(pid)
+                for name, pid in (line.split() for line in raw.splitlines() if line)
+            }
+        except (OSError, ValueError):
+            return {}
 
 
 class CoreCommands(BaseCommands):
@@ -82,48 +191,40 @@ class CoreCommands(BaseCommands):
         """Start message processor"""
         logger.info("Starting message processor...")
 
-        cmd = [sys.executable, "-m", "agency.core.processor"]
-
         if detach:
             # Run in background
-            proc = subprocess.Popen(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                start_new_session=True
-            )
-            self._save_pid(proc.pid, "processor")
-            logger.info(f"✅ Processor started (PID: {proc.pid})")
+            pid = self._spawn_detached(PROCESSOR_CMD)
+            self._save_pids({"processor": pid})
+            logger.info(f"✅ Processor started (PID: {pid})")
             return 0
         else:
             # Run in foreground
-            return subprocess.call(cmd)
+            return self._exec_foreground(PROCESSOR_CMD)
 
     def _start_telegram(self, detach: bool = False):
         """Start Telegram channel"""
         logger.info("Starting Telegram channel...")
 
-        cmd = [sys.executable, "-m", "agency.channels.telegram_channel"]
-
         if detach:
-            proc = subprocess.Popen(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                start_new_session=True
-            )
-            self._save_pid(proc.pid, "telegram")
-            logger.info(f"✅ Telegram started (PID: {proc.pid})")
+            pid = self._spawn_detached(TELEGRAM_CMD)
+            self._save_pids({"telegram": pid})
+            logger.info(f"✅ Telegram started (PID: {pid})")
             return 0
         else:
-            return subprocess.call(cmd)
+            return self._exec_foreground(TELEGRAM_CMD)
 
     def _start_full_system(self, detach: bool = False):
         """Start full system (processor + telegram)"""
         if detach:
-            # Start both in background
-            self._start_processor(detach=True)
-            self._start_telegram(detach=True)
+            # Start both in background, recording their PIDs in one write
+            logger.info("Starting message processor and Telegram channel...")
+            pids = {
+                "processor": self._spawn_detached(PROCESSOR_CMD),
+                "telegram": self._spawn_detached(TELEGRAM_CMD),
+            }
+            self._save_pids(pids)
+            logger.info(f"✅ Processor started (PID: {pids['processor']})")
+            logger.info(f"✅ Telegram started (PID: {pids['telegram']})")
             logger.info("✅ Agency started in background")
             logger.info("Use 'agency logs -f' to view logs")
             logger.info("Use 'agency stop' to stop")
@@ -136,8 +237,11 @@ class CoreCommands(BaseCommands):
             logger.info("Starting Telegram in foreground...")
             logger.info("Press Ctrl+C to stop")
 
+            # Wait on Telegram (rather than exec) so Ctrl+C can also stop
+            # the background processor
+            import subprocess
             try:
-                return self._start_telegram(detach=False)
+                return subprocess.call(TELEGRAM_CMD)
             except KeyboardInterrupt:
                 logger.info("\n⏹️  Stopping Agency...")
                 self.stop(None)
@@ -147,28 +251,37 @@ class CoreCommands(BaseCommands):
         """Stop the Agency system"""
         logger.info("⏹️  Stopping Agency...")
 
-        if not self.is_running():
+        pids = self._load_pids()
+        if not self.is_running(pids):
             logger.warning("⚠️  Agency is not running")
             return 0
 
-        # Get PIDs
-        pids = self._load_pids()
+        import signal
 
-        # Stop processes
-        stopped = []
-        for name, pid in pids.items():
-            try:
-                os.kill(pid, signal.SIGTERM)
-                stopped.append(name)
-                logger.info(f"✅ Stopped {name} (PID: {pid})")
-            except ProcessLookupError:
-                logger.warning(f"⚠️  Process {name} (PID: {pid}) not found")
-            except Exception as e:
-                logger.error(f"❌ Failed to stop {name}: {e}")
+        # Hold Ctrl+C/SIGTERM until the PID file is cleared, so an interrupt
+        # can't leave it listing processes that were already stopped
+        can_block = hasattr(signal, "pthread_sigmask")
+        if can_block:
+            old_mask = signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGINT, signal.SIGTERM})
 
-        # Clear PID file
-        if self.pid_file.exists():
-            self.pid_file.unlink()
+        try:
+            # Stop processes
+            stopped = []
+            for name, pid in pids.items():
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                    stopped.append(name)
+                    logger.info(f"✅ Stopped {name} (PID: {pid})")
+                except ProcessLookupError:
+                    logger.warning(f"⚠️  Process {name} (PID: {pid}) not found")
+                except Exception as e:
+                    logger.error(f"❌ Failed to stop {name}: {e}")
+
+            # Clear PID file
+            self.pid_file.unlink(missing_ok=True)
+        finally:
+            if can_block:
+                signal.pthread_sigmask(signal.SIG_SETMASK, old_mask)
 
         if stopped:
             logger.info("✅ Agency stopped")
@@ -176,41 +289,41 @@ class CoreCommands(BaseCommands):
 
     def status(self, args):
         """Show system status"""
-        running = self.is_running()
+        pids = self._load_pids()
+        running = self.is_running(pids)
 
         if args.json:
             status = {
                 "running": running,
-                "pids": self._load_pids() if running else {},
+                "pids": pids if running else {},
                 "config_dir": str(self.base_dir),
                 "workspace_dir": str(self.workspace_dir)
             }
             print(json.dumps(status, indent=2))
             return 0
 
-        # Human-readable status
-        logger.info("📊 Agency Status")
-        logger.info("=" * 50)
+        # Human-readable status, written in one go
+        lines = ["📊 Agency Status", "=" * 50]
 
         if running:
-            logger.info("Status: ✅ Running")
-            pids = self._load_pids()
+            lines.append("Status: ✅ Running")
             for name, pid in pids.items():
-                logger.info(f"  {name}: PID {pid}")
+                lines.append(f"  {name}: PID {pid}")
         else:
-            logger.info("Status: ⏹️  Stopped")
+            lines.append("Status: ⏹️  Stopped")
 
-        logger.info("")
-        logger.info(f"Config dir: {self.base_dir}")
-        logger.info(f"Workspace:  {self.workspace_dir}")
+        lines.append("")
+        lines.append(f"Config dir: {self.base_dir}")
+        lines.append(f"Workspace:  {self.workspace_dir}")
 
         # Agent count
         agents_data = self.load_agents()
         agent_count = len(agents_data.get("agents", {}))
         team_count = len(agents_data.get("teams", {}))
-        logger.info(f"Agents:     {agent_count}")
-        logger.info(f"Teams:      {team_count}")
+        lines.append(f"Agents:     {agent_count}")
+        lines.append(f"Teams:      {team_count}")
 
+        print("\n".join(lines))
         return 0
 
     def logs(self, args):
@@ -221,26 +334,63 @@ class CoreCommands(BaseCommands):
             logger.warning("No logs found")
             return 1
 
-        if args.follow:
-            # Follow logs
-            try:
-                subprocess.call(["tail", "-f", "-n", str(args.lines), str(log_file)])
-            except KeyboardInterrupt:
-                return 0
-        else:
-            # Show last N lines
-            subprocess.call(["tail", "-n", str(args.lines), str(log_file)])
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        try:
+            with open(log_file, "rb") as f:
+                # Show last N lines
+                sys.stdout.write(decoder.decode(self._read_last_lines(f, args.lines)))
+                sys.stdout.flush()
+
+                if args.follow:
+                    self._follow_log(f, decoder)
+        except KeyboardInterrupt:
+            return 0
 
         return 0
 
+    @staticmethod
+    def _read_last_lines(f, count: int) -> bytes:
+        """Read the last count lines of a binary file, leaving it positioned at the end"""
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        data = b""
+        # One extra newline guarantees the first line kept is complete
+        while pos > 0 and data.count(b"\n") <= count:
+            step = min(LOG_READ_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+        f.seek(end)
+
+        if count <= 0:
+            return b""
+        return b"".join(data.splitlines(keepends=True)[-count:])
+
+    @staticmethod
+    def _follow_log(f, decoder):
+        """Print data appended to an open log file until interrupted (like tail -f)"""
+        while True:
+            chunk = f.read()
+            if chunk:
+                sys.stdout.write(decoder.decode(chunk))
+                sys.stdout.flush()
+                continue
+
+            # Start over if the log was truncated
+            if os.fstat(f.fileno()).st_size < f.tell():
+                f.seek(0)
+            time.sleep(LOG_FOLLOW_INTERVAL)
+
     def version(self, args):
         """Show version information"""
-        logger.info("Agency v0.1.0")
-        logger.info("Multi-agent AI system")
-        logger.info("")
-        logger.info("Inspired by:")
-        logger.info("  - tinyclaw (https://github.com/jlia0/tinyclaw)")
-        logger.info("  - Google Labs CC (https://labs.google/cc)")
+        print(
+            "Agency v0.1.0\n"
+            "Multi-agent AI system\n"
+            "\n"
+            "Inspired by:\n"
+            "  - tinyclaw (https://github.com/jlia0/tinyclaw)\n"
+            "  - Google Labs CC (https://labs.google/cc)"
+        )
         return 0
 
     def web(self, args):
@@ -279,103 +429,101 @@ class CoreCommands(BaseCommands):
 
         # Create default config
         if not self.config_file.exists() or args.force:
-            default_config = {
-                "telegram": {
-                    "enabled": False,
-                    "bot_token": "",
-                    "allowed_users": []
-                },
-                "anthropic": {
-                    "api_key": os.getenv("ANTHROPIC_API_KEY", "")
-                },
-                "workspace_dir": str(self.workspace_dir),
-                "log_level": "INFO"
-            }
-            self.save_config(default_config)
+            self.save_config(self.default_config())
             logger.info("✅ Created config file")
 
         # Create .env.example
         env_example = self.base_dir.parent / "agents" / ".env.example"
         if not env_example.exists():
-            env_content = """# Agency Configuration
-
-# Required
-ANTHROPIC_API_KEY=sk-ant-...
-
-# Telegram (optional)
-TELEGRAM_BOT_TOKEN=
-TELEGRAM_ALLOWED_USERS=
-
-# Google Services (optional - for CC agent)
-GOOGLE_OAUTH_CREDENTIALS_FILE=google_oauth_credentials.json
-GOOGLE_TOKEN_FILE=google_token.pickle
-
-# Social Media (optional)
-TWITTER_API_KEY=
-TWITTER_API_SECRET=
-TWITTER_ACCESS_TOKEN=
-TWITTER_ACCESS_TOKEN_SECRET=
-
-LINKEDIN_CLIENT_ID=
-LINKEDIN_CLIENT_SECRET=
-"""
             env_example.parent.mkdir(parents=True, exist_ok=True)
-            env_example.write_text(env_content)
+            env_example.write_bytes(_ENV_EXAMPLE)
             logger.info("✅ Created .env.example")
 
         logger.info("✅ Workspace initialized!")
-        logger.info("")
-        logger.info(f"Config:     {self.config_file}")
-        logger.info(f"Workspace:  {self.workspace_dir}")
-        logger.info(f"Queues:     {self.base_dir / 'queue'}")
-        logger.info("")
-        logger.info("Next steps:")
-        logger.info("  1. Configure .env with your API keys")
-        logger.info("  2. Run: agency pair telegram")
-        logger.info("  3. Run: agency start")
+        print(
+            "\n"
+            f"Config:     {self.config_file}\n"
+            f"Workspace:  {self.workspace_dir}\n"
+            f"Queues:     {self.base_dir / 'queue'}\n"
+            "\n"
+            "Next steps:\n"
+            "  1. Configure .env with your API keys\n"
+            "  2. Run: agency pair telegram\n"
+            "  3. Run: agency start"
+        )
 
         return 0
 
-    def is_running(self) -> bool:
-        """Check if Agency is running"""
-        if not self.pid_file.exists():
-            return False
-
-        pids = self._load_pids()
-        if not pids:
-            return False
+    def is_running(self, pids: Optional[Dict[str, int]] = None) -> bool:
+        """Check if Agency is running (pids defaults to the PID file's contents)"""
+        if pids is None:
+            pids = self._load_pids()
 
         # Check if any process is still alive
-        for pid in pids.values():
-            try:
-                os.kill(pid, 0)  # Check if process exists
-                return True
-            except ProcessLookupError:
-                continue
+        return any(self._alive(pid) for pid in pids.values())
 
-        return False
+    @staticmethod
+    def _alive(pid: int) -> bool:
+        """Check if a process exists (signal 0 probes without signalling)"""
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            # Exists, but belongs to another user
+            return True
+        return True
 
     def get_pid(self) -> Optional[int]:
         """Get main PID"""
         pids = self._load_pids()
         return pids.get("processor") or pids.get("telegram")
 
-    def _save_pid(self, pid: int, name: str):
-        """Save process PID"""
-        pids = self._load_pids()
-        pids[name] = pid
-        with open(self.pid_file, 'w') as f:
-            json.dump(pids, f)
+    @staticmethod
+    def _exec_foreground(cmd: List[str]) -> int:
+        """
+        Run cmd in the foreground.
+
+        On POSIX the CLI process is replaced by cmd (nothing is left to wait on
+        it and Ctrl+C goes straight to it); elsewhere cmd runs as a child.
+        """
+        if os.name == "posix":
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.execv(cmd[0], cmd)
+
+        import subprocess
+        return subprocess.call(cmd)
+
+    @staticmethod
+    def _spawn_detached(cmd: List[str]) -> int:
+        """Start cmd in its own session with output discarded, returning its PID"""
+        if hasattr(os, "posix_spawn"):
+            # posix_spawn starts the session itself, skipping Popen's fork+exec
+            try:
+                return os.posix_spawn(cmd[0], cmd, os.environ, file_actions=[
+                    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                    (os.POSIX_SPAWN_DUP2, 1, 2),
+                ], setsid=True)
+            except (NotImplementedError, OSError):
+                pass  # No POSIX_SPAWN_SETSID in this libc: use Popen below
+
+        import subprocess
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+        return proc.pid
 
-    def _load_pids(self) -> Dict[str, int]:
-        """Load process PIDs"""
-        if not self.pid_file.exists():
-            return {}
-        try:
-            with open(self.pid_file) as f:
-                return json.load(f)
-        except:
-            return {}
+    def _save_pids(self, new_pids: Dict[str, int]):
+        """Save process PIDs (name -> PID), keeping any already recorded"""
+        pids = self._load_pids()
+        pids.update(new_pids)
+        # One "name pid" pair per line
+        raw = "".join(f"{name} {pid}\n" for name, pid in pids.items())
+        _write_atomic(self.pid_file, raw.encode())
 
 
 class AgentCommands(BaseCommands):
@@ -408,18 +556,18 @@ class AgentCommands(BaseCommands):
             print(json.dumps(agents, indent=2))
             return 0
 
-        # Human-readable list
-        logger.info("🤖 Available Agents")
-        logger.info("=" * 70)
+        # Human-readable list, written in one go
+        lines = ["🤖 Available Agents", "=" * 70]
 
         for agent_id, agent in sorted(agents.items()):
             status = "✅" if agent.get("enabled", True) else "⏸️ "
             model = agent.get("model", "unknown")
             name = agent.get("name", agent_id)
-            logger.info(f"{status} @{agent_id:<15} {name:<30} [{model}]")
+            lines.append(f"{status} @{agent_id:<15} {name:<30} [{model}]")
 
-        logger.info("")
-        logger.info(f"Total: {len(agents)} agents")
+        lines.append("")
+        lines.append(f"Total: {len(agents)} agents")
+        print("\n".join(lines))
         return 0
 
     def agent_info(self, args):
@@ -437,21 +585,24 @@ class AgentCommands(BaseCommands):
             print(json.dumps(agent, indent=2))
             return 0
 
-        # Human-readable info
-        logger.info(f"🤖 Agent: @{args.agent_id}")
-        logger.info("=" * 70)
-        logger.info(f"Name:     {agent.get('name')}")
-        logger.info(f"Model:    {agent.get('model')}")
-        logger.info(f"Provider: {agent.get('provider', 'anthropic')}")
-        logger.info(f"Enabled:  {agent.get('enabled', True)}")
-        logger.info("")
-        logger.info("Personality:")
-        logger.info(f"  {agent.get('personality', 'N/A')}")
-        logger.info("")
-        logger.info("Skills:")
+        # Human-readable info, written in one go
+        lines = [
+            f"🤖 Agent: @{args.agent_id}",
+            "=" * 70,
+            f"Name:     {agent.get('name')}",
+            f"Model:    {agent.get('model')}",
+            f"Provider: {agent.get('provider', 'anthropic')}",
+            f"Enabled:  {agent.get('enabled', True)}",
+            "",
+            "Personality:",
+            f"  {agent.get('personality', 'N/A')}",
+            "",
+            "Skills:",
+        ]
         for skill in agent.get('skills', []):
-            logger.info(f"  • {skill}")
+            lines.append(f"  • {skill}")
 
+        print("\n".join(lines))
         return 0
 
     def create_agent(self, args):
@@ -566,18 +717,18 @@ class TeamCommands(BaseCommands):
             print(json.dumps(teams, indent=2))
             return 0
 
-        # Human-readable list
-        logger.info("👥 Available Teams")
-        logger.info("=" * 70)
+        # Human-readable list, written in one go
+        lines = ["👥 Available Teams", "=" * 70]
 
         for team_id, team in sorted(teams.items()):
             name = team.get("name", team_id)
             agent_count = len(team.get("agents", []))
             leader = team.get("leader_agent", "N/A")
-            logger.info(f"@{team_id:<15} {name:<30} ({agent_count} agents, led by @{leader})")
+            lines.append(f"@{team_id:<15} {name:<30} ({agent_count} agents, led by @{leader})")
 
-        logger.info("")
-        logger.info(f"Total: {len(teams)} teams")
+        lines.append("")
+        lines.append(f"Total: {len(teams)} teams")
+        print("\n".join(lines))
         return 0
 
     def team_info(self, args):
@@ -595,19 +746,22 @@ class TeamCommands(BaseCommands):
             print(json.dumps(team, indent=2))
             return 0
 
-        # Human-readable info
-        logger.info(f"👥 Team: @{args.team_id}")
-        logger.info("=" * 70)
-        logger.info(f"Name:        {team.get('name')}")
-        logger.info(f"Leader:      @{team.get('leader_agent')}")
-        logger.info(f"Description: {team.get('description', 'N/A')}")
-        logger.info("")
-        logger.info("Team Members:")
+        # Human-readable info, written in one go
+        lines = [
+            f"👥 Team: @{args.team_id}",
+            "=" * 70,
+            f"Name:        {team.get('name')}",
+            f"Leader:      @{team.get('leader_agent')}",
+            f"Description: {team.get('description', 'N/A')}",
+            "",
+            "Team Members:",
+        ]
         for agent_id in team.get("agents", []):
             is_leader = agent_id == team.get("leader_agent")
             marker = "👑" if is_leader else "  "
-            logger.info(f"  {marker} @{agent_id}")
+            lines.append(f"  {marker} @{agent_id}")
 
+        print("\n".join(lines))
         return 0
 
     def create_team(self, args):
@@ -630,10 +784,10 @@ class TeamCommands(BaseCommands):
         if args.leader not in team_agents:
             team_agents.insert(0, args.leader)
 
-        for agent_id in team_agents:
-            if agent_id not in agents:
-                logger.error(f"Agent '{agent_id}' not found")
-                return 1
+        missing = set(team_agents) - agents.keys()
+        if missing:
+            logger.error(f"Agents not found: {', '.join(sorted(missing))}")
+            return 1
 
         # Create team
         team = {
@@ -778,28 +932,29 @@ class ConfigCommands(BaseCommands):
         if args.json:
             print(json.dumps(config, indent=2))
         else:
-            logger.info("⚙️  Agency Configuration")
-            logger.info("=" * 50)
-            self._print_dict(config)
+            lines = ["⚙️  Agency Configuration", "=" * 50]
+            self._format_dict(config, lines)
+            print("\n".join(lines))
 
         return 0
 
-    def _print_dict(self, d, indent=0):
-        """Print dictionary with indentation"""
+    def _format_dict(self, d, lines: List[str], indent=0):
+        """Append a dictionary's lines, with indentation, to lines"""
+        prefix = "  " * indent
         for key, value in d.items():
             if isinstance(value, dict):
-                logger.info("  " * indent + f"{key}:")
-                self._print_dict(value, indent + 1)
+                lines.append(f"{prefix}{key}:")
+                self._format_dict(value, lines, indent + 1)
             else:
                 # Mask sensitive values
-                if 'token' in key.lower() or 'key' in key.lower() or 'secret' in key.lower():
+                if _SENSITIVE_KEY.search(key):
                     if value and len(str(value)) > 10:
                         display = str(value)[:10] + "..." + str(value)[-4:]
                     else:
                         display = "***"
                 else:
                     display = value
-                logger.info("  " * indent + f"{key}: {display}")
+                lines.append(f"{prefix}{key}: {display}")
 
     def reset_config(self, args):
         """Reset configuration"""
@@ -809,20 +964,7 @@ class ConfigCommands(BaseCommands):
                 logger.info("Cancelled")
                 return 0
 
-        default_config = {
-            "telegram": {
-                "enabled": False,
-                "bot_token": "",
-                "allowed_users": []
-            },
-            "anthropic": {
-                "api_key": os.getenv("ANTHROPIC_API_KEY", "")
-            },
-            "workspace_dir": str(self.workspace_dir),
-            "log_level": "INFO"
-        }
-
-        self.save_config(default_config)
+        self.save_config(self.default_config())
         logger.info("✅ Configuration reset to defaults")
         return 0
 
@@ -860,10 +1002,17 @@ class PairingCommands(BaseCommands):
         # Test token
         logger.info("Testing token...")
         try:
-            import requests
-            response = requests.get(f"https://api.telegram.org/bot{token}/getMe")
-            if response.status_code == 200:
-                bot_info = response.json()
+            # Plain http.client: importing requests costs more than the call
+            import http.client
+            conn = http.client.HTTPSConnection("api.telegram.org", timeout=10)
+            try:
+                conn.request("GET", f"/bot{token}/getMe")
+                response = conn.getresponse()
+                body = response.read()
+            finally:
+                conn.close()
+            if response.status == 200:
+                bot_info = json.loads(body)
                 bot_name = bot_info['result']['username']
                 logger.info(f"✅ Connected to @{bot_name}")
             else:
@@ -917,15 +1066,15 @@ class PairingCommands(BaseCommands):
             print(json.dumps(pairings, indent=2))
             return 0
 
-        logger.info("🔗 Paired Channels")
-        logger.info("=" * 50)
+        lines = ["🔗 Paired Channels", "=" * 50]
 
         if not pairings:
-            logger.info("No channels paired")
+            lines.append("No channels paired")
         else:
             for channel in pairings:
-                logger.info(f"✅ {channel}")
+                lines.append(f"✅ {channel}")
 
+        print("\n".join(lines))
         return 0
 
 
@@ -1018,8 +1167,8 @@ class MessagingCommands(BaseCommands):
 
     def broadcast(self, args):
         """Broadcast message to multiple agents"""
-        from core.queue_manager import QueueManager
-        from core.message import Message
+        from core.queue import FileQueue
+        from core.types import MessageData
 
         # Determine target agents
         data = self.load_agents()
@@ -1045,16 +1194,22 @@ class MessagingCommands(BaseCommands):
                 logger.error(f"Agent '{agent_id}' not found")
                 return 1
 
-        # Queue messages
-        queue = QueueManager(self.base_dir / "queue")
-        for agent_id in target_agents:
-            msg = Message(
-                user_id='cli',
-                text=args.message,
-                agent_id=agent_id,
-                channel="cli"
+        # Queue one @agent_id message per target in a single batch
+        now = time.time()
+        messages = [
+            MessageData(
+                channel="cli",
+                sender="cli",
+                sender_id="cli",
+                message=f"@{agent_id} {args.message}",
+                timestamp=now,
+                message_id=f"cli_{int(now * 1000)}_{agent_id}",
+                metadata={}
             )
-            queue.enqueue(msg)
+            for agent_id in target_agents
+        ]
+        queue = FileQueue(self.base_dir / "queue")
+        queue.enqueue_many(messages, "incoming")
 
         logger.info(f"✅ Broadcast sent to {len(target_agents)} agents")
         return 0
@@ -1129,8 +1284,11 @@ class DebugCommands(BaseCommands):
         queue = FileQueue(config.queue_path)
         logger.info(f"\n📬 Queue Path: {config.queue_path}")
 
-        # Count messages in each queue
-        incoming_count = queue.get_queue_size("incoming")
+        # Count messages in each queue; the incoming names are kept for the
+        # preview below so that directory is only scanned once
+        with os.scandir(queue.incoming) as entries:
+            incoming_names = [entry.name for entry in entries if entry.name.endswith(".json")]
+        incoming_count = len(incoming_names)
         processing_count = queue.get_queue_size("processing")
         outgoing_count = queue.get_queue_size("outgoing")
 
@@ -1142,11 +1300,13 @@ class DebugCommands(BaseCommands):
         # Show recent incoming messages
         if incoming_count > 0:
             logger.info(f"\n📥 Incoming Messages:")
-            for i, file_path in enumerate(sorted(queue.incoming.glob("*.json"))):
-                if i >= 5:  # Show max 5
-                    break
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
+            # Oldest 5 by name (names start with the enqueue time), without
+            # sorting or reading the rest of the queue
+            for i, name in enumerate(heapq.nsmallest(5, incoming_names, key=FileQueue.order_key)):
+                try:
+                    data = _read_json(queue.incoming / name)
+                except FileNotFoundError:
+                    continue  # Picked up by the processor meanwhile
                 logger.info(f"  {i+1}. From: {data.get('sender', 'unknown')}")
                 logger.info(f"     Message: {data.get('message', '')[:60]}...")
                 logger.info(f"     Time: {time_module.strftime('%Y-%m-%d %H:%M:%S', time_module.localtime(data.get('timestamp', 0)))}")
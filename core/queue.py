@@ -6,16 +6,25 @@ Key insight: File operations are atomic, providing crash recovery for free.
 
 import json
 import logging
+import os
 import time
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Iterator, List, Optional, Union
 import uuid
 
 from core.types import MessageData, QueuedMessage
 
+try:
+    import orjson
+except ImportError:  # Optional C-accelerated JSON
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
+# Digits in a millisecond timestamp, as used by file names before time_ns()
+MS_STAMP_DIGITS = 13
+
 
 class FileQueue:
     """
@@ -25,6 +34,7 @@ class FileQueue:
         incoming/   - New messages waiting to be processed
         processing/ - Messages currently being processed
         outgoing/   - Responses ready to send to channels
+        outgoing/deadletter/ - Responses that repeatedly failed to send
 
     Benefits:
         - Atomic: File rename is atomic
@@ -44,13 +54,15 @@ class FileQueue:
         self.incoming = self.queue_path / "incoming"
         self.processing = self.queue_path / "processing"
         self.outgoing = self.queue_path / "outgoing"
+        self.dead_letter = self.outgoing / "deadletter"
 
         # Create directories
         self.incoming.mkdir(parents=True, exist_ok=True)
         self.processing.mkdir(parents=True, exist_ok=True)
         self.outgoing.mkdir(parents=True, exist_ok=True)
+        self.dead_letter.mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"File queue initialized at {queue_path}")
+        logger.info("File queue initialized at %s", queue_path)
 
     def enqueue(self, message: MessageData, queue_type: str = "incoming") -> Path:
         """
@@ -63,10 +75,13 @@ class FileQueue:
         Returns:
             Path to created file
         """
-        # Generate unique filename
-        timestamp = int(time.time() * 1000)
+        # Generate unique filename; nanoseconds keep files written within the
+        # same millisecond in order, since consumers process them sorted by name
+        # The channel is tagged in the name so pollers can skip other
+        # channels' files without parsing them
+        timestamp = time.time_ns()
         unique_id = str(uuid.uuid4())[:8]
-        filename = f"{timestamp}_{unique_id}.json"
+        filename = f"{timestamp}_{unique_id}.{message.channel}.json"
 
         # Select queue
         if queue_type == "incoming":
@@ -79,12 +94,44 @@ class FileQueue:
         file_path = queue_dir / filename
 
         # Write message as JSON
-        with open(file_path, 'w') as f:
-            json.dump(self._serialize_message(message), f, indent=2)
+        with open(file_path, 'wb') as f:
+            f.write(self._encode_message(message))
 
-        logger.debug(f"Enqueued message to {queue_type}: {filename}")
+        logger.debug("Enqueued message to %s: %s", queue_type, filename)
         return file_path
 
+    def enqueue_many(
+        self,
+        messages: List[MessageData],
+        queue_type: str = "incoming",
+        return_exceptions: bool = False,
+    ) -> List[Union[Path, Exception]]:
+        """
+        Add several messages to the queue in one call.
+
+        Each message still gets its own file, so consumers are unaffected.
+
+        Args:
+            messages: Messages to enqueue, in order
+            queue_type: Queue to add to (incoming/outgoing)
+            return_exceptions: Like asyncio.gather: put a failed message's
+                exception in its result slot and keep writing the rest,
+                instead of raising on the first failure
+
+        Returns:
+            Paths to created files (or exceptions), matching the order of messages
+        """
+        if not return_exceptions:
+            return [self.enqueue(message, queue_type) for message in messages]
+
+        results = []
+        for message in messages:
+            try:
+                results.append(self.enqueue(message, queue_type))
+            except Exception as e:
+                results.append(e)
+        return results
+
     def dequeue(self) -> Optional[QueuedMessage]:
         """
         Get next message from incoming queue (atomic move to processing).
@@ -93,7 +140,7 @@ class FileQueue:
             QueuedMessage if available, None if queue empty
         """
         # Get oldest file in incoming
-        files = sorted(self.incoming.glob("*.json"))
+        files = sorted(self.incoming.glob("*.json"), key=lambda p: self.order_key(p.name))
 
         if not files:
             return None
@@ -110,8 +157,7 @@ class FileQueue:
             return None
 
         # Read message
-        with open(processing_path, 'r') as f:
-            data = json.load(f)
+        data = self._decode_message(processing_path.read_bytes())
 
         message = self._deserialize_message(data)
 
@@ -130,9 +176,9 @@ class FileQueue:
         """
         try:
             queued_message.path.unlink()
-            logger.debug(f"Completed message: {queued_message.path.name}")
+            logger.debug("Completed message: %s", queued_message.path.name)
         except FileNotFoundError:
-            logger.warning(f"Message already deleted: {queued_message.path.name}")
+            logger.warning("Message already deleted: %s", queued_message.path.name)
 
     def recover_orphaned(self) -> int:
         """
@@ -155,32 +201,104 @@ class FileQueue:
                 incoming_path = self.incoming / file_path.name
                 file_path.rename(incoming_path)
                 recovered += 1
-                logger.warning(f"Recovered orphaned message: {file_path.name}")
+                logger.warning("Recovered orphaned message: %s", file_path.name)
 
         if recovered > 0:
-            logger.info(f"Recovered {recovered} orphaned messages")
+            logger.info("Recovered %s orphaned messages", recovered)
 
         return recovered
 
-    def iter_outgoing(self) -> Iterator[QueuedMessage]:
+    def iter_outgoing(self, channel: Optional[str] = None) -> Iterator[QueuedMessage]:
         """
         Iterate over outgoing messages (for channels to poll).
 
-        Yields:
-            QueuedMessage instances from outgoing queue
+        Args:
+            channel: Only load messages for this channel (files written before
+                channel tagging are always loaded)
+
+        Returns:
+            Iterator of QueuedMessage instances from outgoing queue
         """
-        for file_path in sorted(self.outgoing.glob("*.json")):
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+        return self.read_outgoing_many(self.list_outgoing(channel))
 
-            message = self._deserialize_message(data)
+    def list_outgoing(self, channel: Optional[str] = None) -> List[Path]:
+        """
+        List outgoing message files oldest first, without reading them.
+
+        Args:
+            channel: Only list files for this channel (plus untagged files)
+
+        Returns:
+            Paths sorted by name, which starts with the enqueue time
+        """
+        with os.scandir(self.outgoing) as entries:
+            names = [
+                entry.name for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+
+        paths = [self.outgoing / name for name in sorted(names, key=self.order_key)]
+        if channel is not None:
+            paths = [p for p in paths if self.channel_of(p) in (channel, None)]
+        return paths
+
+    def read_outgoing_many(
+        self, paths: List[Path], unreadable: Optional[List[Path]] = None
+    ) -> Iterator[QueuedMessage]:
+        """
+        Load specific outgoing messages, e.g. files reported by a watcher.
+
+        A corrupt or half-written file is logged and skipped, so it can't stop
+        the messages after it from being delivered.
+
+        Args:
+            paths: Paths of outgoing message files
+            unreadable: If given, paths that could not be parsed are appended
+
+        Yields:
+            QueuedMessage instances, skipping files that no longer exist
+        """
+        for file_path in paths:
+            try:
+                message = self._deserialize_message(self._decode_message(file_path.read_bytes()))
+                created_at = file_path.stat().st_ctime
+            except FileNotFoundError:
+                continue
+            except (ValueError, KeyError, TypeError) as e:
+                logger.error("Skipping unreadable outgoing message %s: %s", file_path.name, e)
+                if unreadable is not None:
+                    unreadable.append(file_path)
+                continue
 
             yield QueuedMessage(
                 path=file_path,
                 data=message,
-                created_at=file_path.stat().st_ctime
+                created_at=created_at
             )
 
+    @staticmethod
+    def order_key(name: str) -> str:
+        """
+        Sort key putting queue file names in enqueue order.
+
+        Names start with time.time_ns(); files written by older versions use
+        milliseconds instead, so their timestamp is padded to nanoseconds to
+        keep both kinds in order while a queue still holds leftovers.
+        """
+        stamp_len = name.find("_")
+        if 0 < stamp_len <= MS_STAMP_DIGITS:
+            return name[:stamp_len] + "000000" + name[stamp_len:]
+        return name
+
+    @staticmethod
+    def channel_of(path: Path) -> Optional[str]:
+        """
+        Channel tagged in a queue file's name, e.g. "telegram" for
+        "<ts>_<id>.telegram.json", or None for untagged (older) files.
+        """
+        suffixes = path.suffixes
+        return suffixes[-2][1:] if len(suffixes) >= 2 else None
+
     def delete_outgoing(self, path: Path):
         """
         Delete a message from outgoing queue (after channel sends it).
@@ -190,9 +308,37 @@ class FileQueue:
         """
         try:
             path.unlink()
-            logger.debug(f"Deleted outgoing message: {path.name}")
+            logger.debug("Deleted outgoing message: %s", path.name)
+        except FileNotFoundError:
+            logger.warning("Outgoing message already deleted: %s", path.name)
+
+    def update_outgoing(self, path: Path, message: MessageData):
+        """
+        Rewrite an outgoing message in place (e.g. to record retry state).
+
+        Args:
+            path: Path to message file
+            message: Updated message contents
+        """
+        # Write to a temp file first so pollers never see a partial file
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(self._encode_message(message))
+        tmp_path.replace(path)
+        logger.debug("Updated outgoing message: %s", path.name)
+
+    def move_to_dead_letter(self, path: Path):
+        """
+        Move an undeliverable outgoing message to the dead-letter queue.
+
+        Args:
+            path: Path to message file
+        """
+        try:
+            path.rename(self.dead_letter / path.name)
+            logger.warning("Moved outgoing message to dead-letter queue: %s", path.name)
         except FileNotFoundError:
-            logger.warning(f"Outgoing message already deleted: {path.name}")
+            logger.warning("Outgoing message already deleted: %s", path.name)
 
     def get_queue_size(self, queue_type: str = "incoming") -> int:
         """
@@ -205,14 +351,18 @@ class FileQueue:
             Number of messages
         """
         if queue_type == "incoming":
-            return len(list(self.incoming.glob("*.json")))
+            queue_dir = self.incoming
         elif queue_type == "processing":
-            return len(list(self.processing.glob("*.json")))
+            queue_dir = self.processing
         elif queue_type == "outgoing":
-            return len(list(self.outgoing.glob("*.json")))
+            queue_dir = self.outgoing
         else:
             return 0
 
+        # Count names directly instead of building a Path per file via glob
+        with os.scandir(queue_dir) as entries:
+            return sum(1 for entry in entries if entry.name.endswith(".json"))
+
     def _serialize_message(self, message: MessageData) -> dict:
         """Convert MessageData to JSON-serializable dict"""
         return {
@@ -229,6 +379,19 @@ class FileQueue:
             "metadata": message.metadata,
         }
 
+    def _encode_message(self, message: MessageData) -> bytes:
+        """Encode MessageData as indented UTF-8 JSON (orjson when available)"""
+        data = self._serialize_message(message)
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return json.dumps(data, indent=2).encode()
+
+    def _decode_message(self, raw: bytes) -> dict:
+        """Parse a queue file's JSON (orjson when available)"""
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+
     def _deserialize_message(self, data: dict) -> MessageData:
         """Convert dict to MessageData"""
         return MessageData(
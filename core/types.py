@@ -6,10 +6,15 @@ Inspired by tinyclaw's simplicity - minimal types, maximum flexibility.
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+import sys
 from typing import Dict, List, Optional, Set
 from enum import Enum
 
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 class Provider(str, Enum):
     """AI provider types"""
     ANTHROPIC = "anthropic"
@@ -33,6 +38,11 @@ class AgentConfig:
     working_directory: Path             # Isolated workspace
     personality: Optional[str] = None   # Agent's personality/role description
     skills: List[str] = field(default_factory=list)  # Special skills/capabilities
+    short_desc: Optional[str] = field(default=None, init=False, repr=False)  # First sentence of personality
+
+    def __post_init__(self):
+        if self.personality:
+            self.short_desc = self.personality.split('.', 1)[0] + '.'
 
 
 @dataclass
@@ -52,7 +62,7 @@ class TeamConfig:
     description: Optional[str] = None   # Team purpose
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MessageData:
     """
     A message in the system.
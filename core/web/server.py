@@ -82,13 +82,24 @@ manager = ConnectionManager()
 
 # ─── Helpers ──────────────────────────────────────────────────────────────────
 
+# Parsed agents.json, reused until the file changes: ((mtime_ns, size), data)
+_agents_config_cache: Optional[tuple] = None
+
+
 def load_agents_config() -> dict:
-    """Load agents.json config."""
+    """Load agents.json config (cached until the file changes, so treat it as read-only)."""
+    global _agents_config_cache
     config_path = TEMPLATES_DIR / "agents.json"
-    if config_path.exists():
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
+        return {"agents": {}, "teams": {}}
+
+    key = (st.st_mtime_ns, st.st_size)
+    if _agents_config_cache is None or _agents_config_cache[0] != key:
         with open(config_path) as f:
-            return json.load(f)
-    return {"agents": {}, "teams": {}}
+            _agents_config_cache = (key, json.load(f))
+    return _agents_config_cache[1]
 
 
 def get_queue_counts() -> dict: